@@ -0,0 +1,7 @@
+"""
+benchmark package holds performance scripts for the course modules
+
+Run any of them from the cs4660 folder, e.g.
+
+    python -m benchmark.bench_structure
+"""
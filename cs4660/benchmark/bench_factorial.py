@@ -0,0 +1,26 @@
+"""
+bench_factorial compares the naive recursive fac against the product tree
+factorial, fac only runs below the recursion limit
+"""
+
+import sys
+import timeit
+
+from recursion import factorial
+
+def main(sizes=(500, 900, 10000, 100000), repeat=3):
+    for n in sizes:
+        candidates = [('factorial', factorial.factorial)]
+        if n < sys.getrecursionlimit() - 50:
+            candidates.insert(0, ('fac', factorial.fac))
+        for name, function in candidates:
+            seconds = min(timeit.repeat(lambda: function(n), number=1, repeat=repeat))
+            print("%s(%d): %.6f seconds" % (name, n, seconds))
+
+    memo = factorial.FactorialMemo()
+    memo.factorial(90000)
+    seconds = min(timeit.repeat(lambda: memo.factorial(100000), number=1, repeat=1))
+    print("FactorialMemo(100000) after 90000: %.6f seconds" % seconds)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+bench_search runs every search algorithm against every graph representation
+on the test fixtures and on generated graphs/grids of increasing size
+
+Results are printed as a table and written as JSON (one record per case) so
+two commits can be compared with --compare:
+
+    python -m benchmark.bench_search --output before.json
+    python -m benchmark.bench_search --output after.json --compare before.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import random
+
+try:
+    import tracemalloc
+except ImportError:
+    # python 2 has no tracemalloc, peak memory is reported as None
+    tracemalloc = None
+
+from graph import graph
+from graph import utils
+from search import searches
+
+REPRESENTATIONS = [graph.AdjacencyList, graph.AdjacencyMatrix, graph.ObjectOriented]
+SEARCHES = [searches.bfs, searches.dfs, searches.dijkstra_search, searches.a_star_search]
+
+# matrix and object oriented graphs are O(V^2) / O(E) per query, so the
+# generated cases above these node counts only run on AdjacencyList
+SLOW_REPRESENTATION_LIMIT = 1000
+
+class CountingGraph(object):
+    """
+    CountingGraph forwards to a graph and counts neighbors calls, which is
+    one call per node expanded for all searches
+    """
+    def __init__(self, graph_object):
+        self.graph = graph_object
+        self.expanded = 0
+
+    def neighbors(self, node):
+        self.expanded += 1
+        return self.graph.neighbors(node)
+
+    def __getattr__(self, name):
+        return getattr(self.graph, name)
+
+def fixture_cases():
+    """fixture_cases returns (name, file_path, loader, initial, dest) tuples"""
+    grid_node = lambda x, y, symbol: graph.Node(utils.Tile(x, y, symbol))
+    return [
+        ('graph-1', './test/fixtures/graph-1.txt', graph.construct_graph_from_file,
+         graph.Node(1), graph.Node(8)),
+        ('graph-2', './test/fixtures/graph-2.txt', graph.construct_graph_from_file,
+         graph.Node(0), graph.Node(5)),
+        ('grid-1', './test/fixtures/grid-1.txt', utils.parse_grid_file,
+         grid_node(3, 0, '@1'), grid_node(4, 4, '@6')),
+        ('grid-2', './test/fixtures/grid-2.txt', utils.parse_grid_file,
+         grid_node(3, 0, '@1'), grid_node(13, 0, '@8')),
+        ('grid-3', './test/fixtures/grid-3.txt', utils.parse_grid_file,
+         grid_node(3, 0, '@1'), grid_node(2, 7, '@2')),
+        ('grid-4', './test/fixtures/grid-4.txt', utils.parse_grid_file,
+         grid_node(4, 0, '@1'), grid_node(6, 201, '@4')),
+        ('grid-5', './test/fixtures/grid-5.txt', utils.parse_grid_file,
+         grid_node(4, 0, '@1'), grid_node(201, 206, '@5')),
+    ]
+
+def random_graph(graph_object, number_of_nodes, edges_per_node, seed):
+    """random_graph fills graph_object with a seeded random weighted graph"""
+    generator = random.Random(seed)
+    for index in range(number_of_nodes):
+        graph_object.add_node(graph.Node(index))
+    for index in range(number_of_nodes):
+        # a chain keeps the destination reachable
+        chained = index + 1 < number_of_nodes
+        if chained:
+            graph_object.add_edge(graph.Edge(graph.Node(index), graph.Node(index + 1), 10))
+        # distinct targets without self loops or a second edge to the chain
+        # node, so every representation stores the same edges
+        targets = set()
+        limit = min(edges_per_node - 1, number_of_nodes - 1 - int(chained))
+        while len(targets) < limit:
+            to_index = generator.randrange(number_of_nodes)
+            if to_index != index and to_index != index + 1:
+                targets.add(to_index)
+        for to_index in sorted(targets):
+            graph_object.add_edge(graph.Edge(
+                graph.Node(index), graph.Node(to_index), generator.randint(1, 9)))
+    return graph_object
+
+def open_grid(graph_object, size):
+    """open_grid fills graph_object with a size x size grid without walls"""
+    for y in range(size):
+        for x in range(size):
+            node = graph.Node(utils.Tile(x, y, '  '))
+            graph_object.add_node(node)
+            for dx, dy in utils.DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < size and 0 <= ny < size:
+                    graph_object.add_edge(graph.Edge(
+                        node, graph.Node(utils.Tile(nx, ny, '  ')), 1))
+    return graph_object
+
+def generated_cases(sizes):
+    """generated_cases returns (name, builder, node_count, initial, dest) tuples"""
+    cases = []
+    for size in sizes:
+        cases.append((
+            'random-%d' % size,
+            lambda g, size=size: random_graph(g, size, 4, seed=size),
+            size,
+            graph.Node(0),
+            graph.Node(size - 1)
+        ))
+        side = max(2, int(size ** 0.5))
+        cases.append((
+            'grid-open-%d' % (side * side),
+            lambda g, side=side: open_grid(g, side),
+            side * side,
+            graph.Node(utils.Tile(0, 0, '  ')),
+            graph.Node(utils.Tile(side - 1, side - 1, '  '))
+        ))
+    return cases
+
+def percentile(samples, fraction):
+    """percentile returns the nearest rank percentile of samples"""
+    ordered = sorted(samples)
+    index = max(0, int(math.ceil(fraction * len(ordered))) - 1)
+    return ordered[index]
+
+def measure(search, graph_object, initial_node, dest_node, repeat):
+    """
+    measure times search repeat times, then runs it once more under
+    tracemalloc for peak memory so tracing does not skew the latencies
+    """
+    counting_graph = CountingGraph(graph_object)
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = searches.TIMER()
+        search(graph_object, initial_node, dest_node)
+        samples.append(searches.TIMER() - start_time)
+
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+    try:
+        path = search(counting_graph, initial_node, dest_node)
+    finally:
+        if tracemalloc is not None:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return {
+        'median_seconds': percentile(samples, 0.5),
+        'p95_seconds': percentile(samples, 0.95),
+        'nodes_expanded': counting_graph.expanded,
+        'path_length': len(path),
+        'peak_memory_bytes': peak,
+    }
+
+def run(sizes, repeat):
+    """run benchmarks every case and returns the list of records"""
+    records = []
+    cases = [(name, lambda g, path=path, loader=loader: loader(g, path), 0, initial, dest)
+             for name, path, loader, initial, dest in fixture_cases()]
+    cases.extend(generated_cases(sizes))
+
+    for name, builder, node_count, initial_node, dest_node in cases:
+        for representation in REPRESENTATIONS:
+            is_large_fixture = name in ('grid-4', 'grid-5')
+            if representation is not graph.AdjacencyList and \
+                    (is_large_fixture or node_count > SLOW_REPRESENTATION_LIMIT):
+                continue
+            graph_object = builder(representation())
+            for search in SEARCHES:
+                record = {
+                    'case': name,
+                    'representation': representation.__name__,
+                    'search': search.__name__,
+                    'repeat': repeat,
+                }
+                try:
+                    record.update(measure(search, graph_object, initial_node, dest_node, repeat))
+                except RuntimeError as error:
+                    # e.g. recursion limit on deep graphs, kept as a result
+                    record['error'] = str(error)
+                    print('%-16s %-16s %-16s error %s' % (
+                        name, record['representation'], record['search'], error))
+                    records.append(record)
+                    continue
+                records.append(record)
+                print('%-16s %-16s %-16s median %.6fs p95 %.6fs expanded %d' % (
+                    name, record['representation'], record['search'],
+                    record['median_seconds'], record['p95_seconds'],
+                    record['nodes_expanded']))
+    return records
+
+def compare(records, baseline_path, threshold):
+    """compare prints cases whose median got slower than threshold times baseline"""
+    with open(baseline_path) as file_object:
+        baseline = json.load(file_object)['results']
+    key = lambda record: (record['case'], record['representation'], record['search'])
+    previous = dict((key(record), record) for record in baseline)
+    regressions = 0
+    for record in records:
+        before = previous.get(key(record))
+        if before is None or 'error' in record or 'error' in before or \
+                before['median_seconds'] <= 0:
+            continue
+        ratio = record['median_seconds'] / before['median_seconds']
+        if ratio > threshold:
+            regressions += 1
+            print('REGRESSION %s %s %s: %.2fx slower' % (key(record) + (ratio,)))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='*', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default='bench_search.json')
+    parser.add_argument('--compare', help='previous --output file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+
+    records = run(args.sizes, args.repeat)
+    with open(args.output, 'w') as file_object:
+        json.dump({'sizes': args.sizes, 'results': records}, file_object, indent=2)
+
+    if args.compare and compare(records, args.compare, args.threshold):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
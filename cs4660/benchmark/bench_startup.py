@@ -0,0 +1,92 @@
+"""
+bench_startup measures the cold start of a worker that only runs bfs on a
+prebuilt graph, and checks it against an import time budget
+
+Each run is a fresh interpreter timed from just before our first import, so
+the budget only covers our imports and not the interpreter start. The script
+exits with 1 when the budget is exceeded or when a lazily loaded module was
+imported.
+
+    python -m benchmark.bench_startup
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# the cs4660 folder, so the worker can import graph and search
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# seconds our imports may add on top of a bare interpreter start
+IMPORT_BUDGET_SECONDS = 0.03
+
+# modules only the optional modes need, they must stay out of a bfs worker
+LAZY_MODULES = ['multiprocessing', 'mmap', 'urllib', 'urllib2', 'json', 'tracemalloc']
+
+WORKER = '''
+import sys
+import time
+start_time = time.time()
+from graph import graph
+from search import searches
+imported = time.time()
+g = graph.AdjacencyList()
+for index in range(10):
+    g.add_edge(graph.Edge(graph.Node(index), graph.Node(index + 1), 1))
+searches.bfs(g, graph.Node(0), graph.Node(10))
+finished = time.time()
+# listed before json is imported for the output
+modules = sorted(sys.modules)
+import json
+print(json.dumps([imported - start_time, finished - start_time, modules]))
+'''
+
+def run_python(code):
+    """run_python runs code in a fresh interpreter from the cs4660 folder and returns its stdout"""
+    return subprocess.check_output([sys.executable, '-c', code], cwd=ROOT).decode('utf-8')
+
+def measure(repeat):
+    """measure returns the per run import seconds, total seconds and the imported modules"""
+    import_samples = []
+    total_samples = []
+    modules = []
+    for _ in range(repeat):
+        import_seconds, total_seconds, modules = json.loads(run_python(WORKER))
+        import_samples.append(import_seconds)
+        total_samples.append(total_seconds)
+    return sorted(import_samples), sorted(total_samples), modules
+
+def main():
+    parser = argparse.ArgumentParser(description='cold start benchmark for a bfs worker')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_SECONDS)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    import_samples, total_samples, modules = measure(args.repeat)
+    median_import = import_samples[len(import_samples) // 2]
+    median_total = total_samples[len(total_samples) // 2]
+    loaded = [name for name in LAZY_MODULES if name in modules]
+
+    print("import: %.6f seconds (budget %.6f)" % (median_import, args.budget))
+    print("import + bfs: %.6f seconds" % median_total)
+    print("modules loaded: %d" % len(modules))
+    if loaded:
+        print("lazy modules imported eagerly: %s" % ', '.join(loaded))
+
+    if args.output:
+        with open(args.output, 'w') as file_object:
+            json.dump({
+                'median_import_seconds': median_import,
+                'median_total_seconds': median_total,
+                'budget_seconds': args.budget,
+                'modules': modules,
+            }, file_object, indent=2)
+
+    if loaded or median_import > args.budget:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
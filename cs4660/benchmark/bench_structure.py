@@ -0,0 +1,62 @@
+"""
+bench_structure compares the open addressing HashTable against the previous
+dict backed implementation
+"""
+
+import random
+import string
+import timeit
+
+from datastructure import structure
+
+class LegacyHashTable(object):
+    """LegacyHashTable is the previous HashTable kept for comparison"""
+    def __init__(self):
+        self.memory = {}
+
+    def hashKey(self, key):
+        hash_token = 0
+        for character in key:
+            hash_token = 101 * hash_token + ord(character)
+        return hash_token
+
+    def get(self, key):
+        address = self.hashKey(key)
+        return self.memory[address]
+
+    def set(self, key, value):
+        address = self.hashKey(key)
+        self.memory[address] = value
+
+    def remove(self, key):
+        address = self.hashKey(key)
+        if address in self.memory:
+            del self.memory[address]
+
+def random_keys(count, length=12, seed=4660):
+    """random_keys returns count random lowercase keys"""
+    generator = random.Random(seed)
+    letters = string.ascii_lowercase
+    return [''.join(generator.choice(letters) for _ in range(length))
+            for _ in range(count)]
+
+def run(table_class, keys):
+    """run sets, gets and removes every key against a new table"""
+    table = table_class()
+    for index, key in enumerate(keys):
+        table.set(key, index)
+    for key in keys:
+        table.get(key)
+    for key in keys[::2]:
+        table.remove(key)
+    return table
+
+def main(count=100000, repeat=3):
+    keys = random_keys(count)
+    for table_class in (LegacyHashTable, structure.HashTable):
+        seconds = min(timeit.repeat(
+            lambda: run(table_class, keys), number=1, repeat=repeat))
+        print("%s: %.6f seconds for %d keys" % (table_class.__name__, seconds, count))
+
+if __name__ == "__main__":
+    main()
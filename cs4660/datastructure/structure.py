@@ -1,3 +1,5 @@
+from array import array
+
 class List(object):
     def __init__(self):
         self.memory = []
@@ -52,25 +54,429 @@ class List(object):
 
         return value
 
+class TypedList(object):
+    """
+    TypedList is a List storing numbers unboxed in an array buffer, selected
+    by an array type code ('i' for ints, 'd' for floats, ...)
+    """
+    def __init__(self, type_code='d', values=()):
+        self.type_code = type_code
+        self.memory = array(type_code)
+        # shift only moves the start address forward, the freed head is
+        # reclaimed once it grows past half of the memory
+        self.start = 0
+        self.length = 0
+        # items shifted off the head minus items unshifted, views keep
+        # absolute positions so they follow their items across shifts
+        self.shifted = 0
+        self.extend(values)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        memory = self.memory
+        for address in range(self.start, self.start + self.length):
+            yield memory[address]
+
+    def get(self, address):
+        if address < 0 or address >= self.length:
+            raise IndexError(address)
+        return self.memory[self.start + address]
+
+    def push(self, value):
+        self.memory.append(value)
+        self.length += 1
+
+    def extend(self, values):
+        # converting into a temporary array first runs in C and leaves
+        # memory untouched when a value does not fit the type code
+        if not isinstance(values, array) or values.typecode != self.type_code:
+            values = array(self.type_code, values)
+        self.memory.extend(values)
+        self.length += len(values)
+
+    def pop(self):
+        if self.length == 0:
+            return
+
+        self.length -= 1
+        value = self.memory.pop()
+        if self.length == 0:
+            self.__compact()
+        return value
+
+    def unshift(self, value):
+        # push item to beginning of the list
+        if self.start == 0:
+            # reserve head room in one go so repeated unshift stays cheap
+            room = max(8, self.length)
+            self.memory[0:0] = array(self.type_code, [0]) * room
+            self.start = room
+
+        self.start -= 1
+        self.shifted -= 1
+        self.memory[self.start] = value
+        self.length += 1
+
+    def shift(self):
+        # pop first item out of list
+        if self.length == 0:
+            return
+
+        value = self.memory[self.start]
+        self.start += 1
+        self.shifted += 1
+        self.length -= 1
+        if self.start > len(self.memory) // 2:
+            self.__compact()
+        return value
+
+    def view(self, start=0, stop=None):
+        """view returns a TypedListView over [start, stop) without copying"""
+        if stop is None or stop > self.length:
+            stop = self.length
+        start = max(0, min(start, stop))
+        return TypedListView(self, self.shifted + start, stop - start)
+
+    def itemsize(self):
+        """itemsize returns the bytes used per stored element"""
+        return self.memory.itemsize
+
+    def __compact(self):
+        """helper method to drop the unused head of memory"""
+        del self.memory[:self.start]
+        self.start = 0
+
+class TypedListView(object):
+    """
+    TypedListView is a read only window over items of a TypedList, addresses
+    are relative to the start of the view. The window is anchored to the
+    items, not to the list head, so shift and unshift do not move it, items
+    removed from the list raise IndexError
+    """
+    def __init__(self, typed_list, position, length):
+        self.typed_list = typed_list
+        # absolute position of the first item, see TypedList.shifted
+        self.position = position
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for address in range(self.length):
+            yield self.get(address)
+
+    def get(self, address):
+        if address < 0 or address >= self.length:
+            raise IndexError(address)
+        return self.typed_list.get(self.position - self.typed_list.shifted + address)
+
+    def to_array(self):
+        """to_array copies the viewed values still in the list into a new array"""
+        typed_list = self.typed_list
+        begin = max(self.position - typed_list.shifted, 0)
+        end = min(self.position - typed_list.shifted + self.length, typed_list.length)
+        if end <= begin:
+            return array(typed_list.type_code)
+        return typed_list.memory[typed_list.start + begin:typed_list.start + end]
+
+# sentinel marking a slot whose entry was removed so probing continues past it
+_TOMBSTONE = object()
+
 class HashTable(object):
-    def __init__(self):
-        self.memory = {}
+    """
+    HashTable is an open addressing hash table using linear probing over a
+    preallocated memory array, with tombstones on remove and resizing driven
+    by load factor
+    """
+    def __init__(self, capacity=8, load_factor=0.66):
+        # probes stop at the first None slot, so at least one must stay free
+        if not 0 < load_factor < 1:
+            raise ValueError('load_factor must be between 0 and 1, got {}'.format(load_factor))
+        size = 8
+        while size < capacity:
+            size <<= 1
+        # each slot is either None (never used), _TOMBSTONE, or a
+        # (hash, key, value) tuple
+        self.memory = [None] * size
+        self.capacity = size
+        self.load_factor = load_factor
+        # number of live entries
+        self.length = 0
+        # number of live entries plus tombstones, which both lengthen probes
+        self.used = 0
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, key):
+        return self.__find_slot(key, self.hashKey(key)) >= 0
 
     def hashKey(self, key):
-        hash_token = 0
-        for character in key:
-            hash_token = 101 * hash_token + ord(character)
-        return hash_token
+        # builtin hash runs in C and is cached on str objects
+        return hash(key)
 
     def get(self, key):
-        address = self.hashKey(key)
-        return self.memory[address]
+        address = self.__find_slot(key, self.hashKey(key))
+        if address < 0:
+            raise KeyError(key)
+        return self.memory[address][2]
 
     def set(self, key, value):
-        address = self.hashKey(key)
-        self.memory[address] = value
+        if self.used + 1 > self.capacity * self.load_factor:
+            self.__resize()
+
+        hash_token = self.hashKey(key)
+        memory = self.memory
+        mask = self.capacity - 1
+        address = hash_token & mask
+        # first tombstone seen on the probe, reused if the key is not present
+        free_address = -1
+        while True:
+            slot = memory[address]
+            if slot is None:
+                break
+            if slot is _TOMBSTONE:
+                if free_address < 0:
+                    free_address = address
+            elif slot[0] == hash_token and (slot[1] is key or slot[1] == key):
+                memory[address] = (hash_token, key, value)
+                return
+            address = (address + 1) & mask
+
+        if free_address >= 0:
+            address = free_address
+        else:
+            self.used += 1
+        memory[address] = (hash_token, key, value)
+        self.length += 1
 
     def remove(self, key):
-        address = self.hashKey(key)
-        if address in self.memory:
-            del self.memory[address]
+        address = self.__find_slot(key, self.hashKey(key))
+        if address >= 0:
+            self.memory[address] = _TOMBSTONE
+            self.length -= 1
+
+    def keys(self):
+        return [slot[1] for slot in self.memory
+                if slot is not None and slot is not _TOMBSTONE]
+
+    def __find_slot(self, key, hash_token):
+        """helper method to find the address holding key, or -1 if absent"""
+        memory = self.memory
+        mask = self.capacity - 1
+        address = hash_token & mask
+        while True:
+            slot = memory[address]
+            if slot is None:
+                return -1
+            if slot is not _TOMBSTONE and slot[0] == hash_token and \
+                    (slot[1] is key or slot[1] == key):
+                return address
+            address = (address + 1) & mask
+
+    def __resize(self):
+        """
+        helper method to rehash every live entry into a new memory array,
+        doubling capacity when mostly full of live entries and otherwise
+        only dropping tombstones
+        """
+        capacity = self.capacity
+        if self.length + 1 > capacity * self.load_factor / 2:
+            capacity <<= 1
+
+        old_memory = self.memory
+        memory = [None] * capacity
+        mask = capacity - 1
+        for slot in old_memory:
+            if slot is None or slot is _TOMBSTONE:
+                continue
+            address = slot[0] & mask
+            while memory[address] is not None:
+                address = (address + 1) & mask
+            memory[address] = slot
+
+        self.memory = memory
+        self.capacity = capacity
+        self.used = self.length
+
+class IndexedMinHeap(object):
+    """
+    IndexedMinHeap is a binary min heap that keeps a position index of every
+    item so decrease_key runs in O(log n) instead of pushing duplicates
+    """
+    def __init__(self):
+        # each entry is [priority, insertion order, item], the insertion
+        # order breaks ties so equal priorities pop first in first out
+        self.memory = []
+        self.positions = {}
+        self.counter = 0
+
+    def __len__(self):
+        return len(self.memory)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def priority(self, item):
+        return self.memory[self.positions[item]][0]
+
+    def push(self, item, priority):
+        """push adds item, or updates its priority when already queued"""
+        if item in self.positions:
+            address = self.positions[item]
+            old_priority = self.memory[address][0]
+            self.memory[address][0] = priority
+            if priority < old_priority:
+                self.__sift_up(address)
+            else:
+                self.__sift_down(address)
+            return
+
+        self.counter += 1
+        self.memory.append([priority, self.counter, item])
+        self.positions[item] = len(self.memory) - 1
+        self.__sift_up(len(self.memory) - 1)
+
+    def pop_min(self):
+        """pop_min removes and returns (item, priority) with the lowest priority"""
+        if not self.memory:
+            return
+
+        memory = self.memory
+        last = memory.pop()
+        if memory:
+            entry = memory[0]
+            memory[0] = last
+            self.positions[last[2]] = 0
+            self.__sift_down(0)
+        else:
+            entry = last
+        del self.positions[entry[2]]
+        return entry[2], entry[0]
+
+    def decrease_key(self, item, priority):
+        """
+        decrease_key lowers the priority of a queued item, returns false if
+        the item is absent or already has a lower or equal priority
+        """
+        address = self.positions.get(item)
+        if address is None or self.memory[address][0] <= priority:
+            return False
+        self.memory[address][0] = priority
+        self.__sift_up(address)
+        return True
+
+    def __sift_up(self, address):
+        """helper method to move entry at address up until heap is ordered"""
+        memory = self.memory
+        positions = self.positions
+        entry = memory[address]
+        priority, order = entry[0], entry[1]
+        while address > 0:
+            parent = (address - 1) >> 1
+            parent_entry = memory[parent]
+            if parent_entry[0] < priority or \
+                    (parent_entry[0] == priority and parent_entry[1] < order):
+                break
+            memory[address] = parent_entry
+            positions[parent_entry[2]] = address
+            address = parent
+        memory[address] = entry
+        positions[entry[2]] = address
+
+    def __sift_down(self, address):
+        """helper method to move entry at address down until heap is ordered"""
+        memory = self.memory
+        positions = self.positions
+        size = len(memory)
+        entry = memory[address]
+        priority, order = entry[0], entry[1]
+        while True:
+            child = 2 * address + 1
+            if child >= size:
+                break
+            child_entry = memory[child]
+            right = child + 1
+            if right < size:
+                right_entry = memory[right]
+                if right_entry[0] < child_entry[0] or \
+                        (right_entry[0] == child_entry[0] and right_entry[1] < child_entry[1]):
+                    child, child_entry = right, right_entry
+            if priority < child_entry[0] or \
+                    (priority == child_entry[0] and order < child_entry[1]):
+                break
+            memory[address] = child_entry
+            positions[child_entry[2]] = address
+            address = child
+        memory[address] = entry
+        positions[entry[2]] = address
+
+class RadixHeap(object):
+    """
+    RadixHeap is a monotone priority queue for non negative integer
+    priorities: a pushed priority must not be lower than the last popped one,
+    which holds for dijkstra with integer weights
+    """
+    def __init__(self):
+        # bucket i holds items whose priority differs from last_popped in
+        # bit i - 1 as the highest bit, bucket 0 holds priority == last_popped
+        self.buckets = [{} for _ in range(65)]
+        self.positions = {}
+        self.last_popped = 0
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def priority(self, item):
+        return self.buckets[self.positions[item]][item]
+
+    def push(self, item, priority):
+        """push adds item, or updates its priority when already queued"""
+        if priority < self.last_popped:
+            raise ValueError('priority {} is lower than last popped {}'.format(
+                priority, self.last_popped))
+        if item in self.positions:
+            del self.buckets[self.positions[item]][item]
+        self.__place(item, priority)
+
+    def pop_min(self):
+        """pop_min removes and returns (item, priority) with the lowest priority"""
+        if not self.positions:
+            return
+
+        buckets = self.buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket = buckets[index]
+            buckets[index] = {}
+            self.last_popped = min(bucket.values())
+            for item, priority in bucket.items():
+                self.__place(item, priority)
+
+        item, priority = buckets[0].popitem()
+        del self.positions[item]
+        return item, priority
+
+    def decrease_key(self, item, priority):
+        """
+        decrease_key lowers the priority of a queued item, returns false if
+        the item is absent or already has a lower or equal priority
+        """
+        if item not in self.positions or self.priority(item) <= priority:
+            return False
+        self.push(item, priority)
+        return True
+
+    def __place(self, item, priority):
+        """helper method to put item into the bucket matching priority"""
+        index = (priority ^ self.last_popped).bit_length()
+        self.buckets[index][item] = priority
+        self.positions[item] = index
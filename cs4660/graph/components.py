@@ -0,0 +1,232 @@
+"""
+components module keeps a connected components index next to a graph so
+searches can answer "no path" without exploring a whole component
+
+    indexed = ComponentIndex(graph.construct_graph_from_file(graph.AdjacencyList(), path))
+    searches.bfs(indexed, node_1, node_2)  # returns [] at once when unreachable
+
+Two facts are tracked:
+
+* weakly connected components (union find), updated on every add_edge
+* strongly connected components with a topological rank of the condensation,
+  a path from node_1 to node_2 can only exist when rank(node_1) < rank(node_2)
+  or both are in the same component
+
+New nodes are ranked before every other node, and an edge joining two weak
+components moves the smaller one past the other in the order, so only a
+backward edge inside one weak component needs a rebuild. Removals never make
+the index wrong, they only make it less precise, so they just mark it stale
+and it is rebuilt on the next query.
+"""
+
+from __future__ import absolute_import
+
+from graph import graph
+
+class ComponentIndex(object):
+    """
+    ComponentIndex wraps a graph, forwards every graph method to it and
+    answers unreachable(node_1, node_2) in O(1)
+    """
+    def __init__(self, graph_object):
+        self.graph = graph_object
+        self.stale = True
+        self.rebuild()
+
+    def adjacent(self, node_1, node_2):
+        return self.graph.adjacent(node_1, node_2)
+
+    def neighbors(self, node):
+        return self.graph.neighbors(node)
+
+    def distance(self, node_1, node_2):
+        return self.graph.distance(node_1, node_2)
+
+    def add_node(self, node):
+        added = self.graph.add_node(node)
+        if added and not self.stale:
+            self.__add_singleton(node)
+        return added
+
+    def remove_node(self, node):
+        removed = self.graph.remove_node(node)
+        if removed:
+            self.stale = True
+        return removed
+
+    def add_edge(self, edge):
+        added = self.graph.add_edge(edge)
+        if not added or self.stale:
+            return added
+
+        for node in (edge.from_node, edge.to_node):
+            if node not in self.parents:
+                self.__add_singleton(node)
+        root_1 = self.__find(edge.from_node)
+        root_2 = self.__find(edge.to_node)
+        if root_1 != root_2:
+            # nothing leads back between two weak components, so the edge
+            # cannot close a cycle
+            self.__join(root_1, root_2)
+            return added
+
+        # an edge going forward in topological order cannot close a cycle,
+        # only a backward one may merge components and needs a rebuild
+        if self.ranks[self.components[edge.from_node]] > self.ranks[self.components[edge.to_node]]:
+            self.stale = True
+        return added
+
+    def remove_edge(self, edge):
+        removed = self.graph.remove_edge(edge)
+        if removed:
+            self.stale = True
+        return removed
+
+    def unreachable(self, node_1, node_2):
+        """unreachable returns true only when there is surely no path from node_1 to node_2"""
+        if node_1 == node_2:
+            return False
+        if self.stale:
+            self.rebuild()
+        if node_1 not in self.parents or node_2 not in self.parents:
+            return True
+        if self.__find(node_1) != self.__find(node_2):
+            return True
+        return self.ranks[self.components[node_1]] > self.ranks[self.components[node_2]]
+
+    def strongly_connected(self, node_1, node_2):
+        """strongly_connected returns true when both nodes can reach each other"""
+        if self.stale:
+            self.rebuild()
+        component = self.components.get(node_1)
+        return component is not None and component == self.components.get(node_2)
+
+    def rebuild(self):
+        """rebuild recomputes both indexes from the wrapped graph"""
+        nodes = graph_nodes(self.graph)
+        self.parents = dict((node, node) for node in nodes)
+        for node in nodes:
+            for neighbor in self.graph.neighbors(node):
+                self.__union(node, neighbor)
+
+        self.components = {}
+        self.ranks = []
+        components = strongly_connected_components(self.graph, nodes)
+        # tarjan finds sink components first, so rank counts down
+        # weak root -> ids of the strong components inside it
+        self.members = {}
+        for index, component in enumerate(components):
+            for node in component:
+                self.components[node] = index
+            self.ranks.append(len(components) - 1 - index)
+            self.members.setdefault(self.__find(component[0]), []).append(index)
+        self.lowest = 0
+        self.highest = len(components) - 1
+        self.stale = False
+
+    def __add_singleton(self, node):
+        """helper method to index a new node as its own component, first in order"""
+        self.lowest -= 1
+        self.parents[node] = node
+        self.components[node] = len(self.ranks)
+        self.members[node] = [len(self.ranks)]
+        self.ranks.append(self.lowest)
+
+    def __join(self, root_1, root_2):
+        """
+        helper method merging two weak components so that every rank of
+        root_2's comes after root_1's, only the smaller one is re-ranked
+        """
+        ranks = self.ranks
+        members_1 = self.members.pop(root_1)
+        members_2 = self.members.pop(root_2)
+        if len(members_2) <= len(members_1):
+            offset = self.highest + 1 - min(ranks[index] for index in members_2)
+            for index in members_2:
+                ranks[index] += offset
+            self.highest = max(ranks[index] for index in members_2)
+        else:
+            offset = self.lowest - 1 - max(ranks[index] for index in members_1)
+            for index in members_1:
+                ranks[index] += offset
+            self.lowest = min(ranks[index] for index in members_1)
+
+        # the larger member list absorbs the smaller one
+        if len(members_1) < len(members_2):
+            root_1, root_2 = root_2, root_1
+            members_1, members_2 = members_2, members_1
+        members_1.extend(members_2)
+        self.parents[root_2] = root_1
+        self.members[root_1] = members_1
+
+    def __find(self, node):
+        """helper method returning the union find root of node with path halving"""
+        parents = self.parents
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    def __union(self, node_1, node_2):
+        """helper method merging the weak components of both nodes"""
+        root_1 = self.__find(node_1)
+        root_2 = self.__find(node_2)
+        if root_1 != root_2:
+            self.parents[root_1] = root_2
+
+def graph_nodes(graph_object):
+    """graph_nodes returns the list of nodes of any representation"""
+    if isinstance(graph_object, graph.AdjacencyList):
+        return list(graph_object.adjacency_list)
+    return list(graph_object.nodes)
+
+def strongly_connected_components(graph_object, nodes=None):
+    """
+    strongly_connected_components returns the components of the graph as
+    lists of nodes in reverse topological order, using an iterative
+    version of tarjan's algorithm so deep graphs do not hit the recursion limit
+    """
+    if nodes is None:
+        nodes = graph_nodes(graph_object)
+
+    indexes = {}
+    low_links = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+    for root in nodes:
+        if root in indexes:
+            continue
+        indexes[root] = low_links[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph_object.neighbors(root)))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in indexes:
+                    indexes[neighbor] = low_links[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph_object.neighbors(neighbor))))
+                    break
+                if neighbor in on_stack:
+                    low_links[node] = min(low_links[node], indexes[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[node])
+                if low_links[node] == indexes[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
@@ -0,0 +1,225 @@
+"""
+generator module writes synthetic graphs and grids for scaling tests
+
+Graphs use the construct_graph_from_file format (node count, then one
+from:to:weight edge per line) and grids use the parse_grid_file format. Every
+writer streams to a file object and keeps at most one node's edges or one row
+of tiles in memory, so outputs can reach tens of millions of edges, e.g.
+
+    python -m graph.generator graph scale-free --nodes 5000000 --degree 4 -o big.txt
+    python -m graph.generator grid maze --width 5000 --height 5000 -o maze.txt
+"""
+
+import argparse
+import random
+from io import open
+
+def write_random_graph(file_object, number_of_nodes, degree, seed=None, max_weight=9):
+    """
+    write_random_graph writes a graph where every node has degree edges to
+    uniformly random other nodes
+    """
+    generator = random.Random(seed)
+    degree = min(degree, number_of_nodes - 1)
+    file_object.write(u'%d\n' % number_of_nodes)
+    for from_index in range(number_of_nodes):
+        targets = set()
+        while len(targets) < degree:
+            to_index = generator.randrange(number_of_nodes)
+            if to_index != from_index:
+                targets.add(to_index)
+        __write_edges(file_object, generator, from_index, sorted(targets), max_weight)
+
+def write_scale_free_graph(file_object, number_of_nodes, degree, seed=None,
+                           exponent=0.5, max_weight=9):
+    """
+    write_scale_free_graph writes a Chung-Lu style graph whose in-degree
+    follows a power law: targets are drawn with probability proportional to
+    (index + 1) ** -exponent by inverse transform sampling, so low indices
+    become hubs without keeping a degree table in memory
+
+    exponent must be between 0 and 1
+    """
+    generator = random.Random(seed)
+    degree = min(degree, number_of_nodes - 1)
+    power = 1.0 / (1.0 - exponent)
+    file_object.write(u'%d\n' % number_of_nodes)
+    for from_index in range(number_of_nodes):
+        targets = set()
+        while len(targets) < degree:
+            to_index = int(number_of_nodes * generator.random() ** power)
+            if to_index != from_index and to_index < number_of_nodes:
+                targets.add(to_index)
+        __write_edges(file_object, generator, from_index, sorted(targets), max_weight)
+
+def write_road_graph(file_object, width, height, seed=None, drop_rate=0.1,
+                     shortcut_rate=0.01, max_weight=9):
+    """
+    write_road_graph writes a road-like network: nodes on a width x height
+    lattice joined in both directions to their east and south neighbors,
+    with drop_rate of the streets missing and shortcut_rate of the nodes
+    getting a longer highway edge to a node a few blocks away
+    """
+    generator = random.Random(seed)
+    file_object.write(u'%d\n' % (width * height))
+    for y in range(height):
+        lines = []
+        for x in range(width):
+            index = y * width + x
+            neighbors = []
+            if x + 1 < width:
+                neighbors.append(index + 1)
+            if y + 1 < height:
+                neighbors.append(index + width)
+            for to_index in neighbors:
+                if generator.random() < drop_rate:
+                    continue
+                weight = generator.randint(1, max_weight)
+                lines.append(u'%d:%d:%d\n%d:%d:%d\n' % (
+                    index, to_index, weight, to_index, index, weight))
+            if generator.random() < shortcut_rate:
+                to_x = min(width - 1, x + generator.randint(2, 10))
+                to_y = min(height - 1, y + generator.randint(2, 10))
+                to_index = to_y * width + to_x
+                # clamped at the border a shortcut can land on the node
+                # itself or on a street that already exists
+                if to_x - x + to_y - y > 1:
+                    weight = (to_x - x + to_y - y) * max_weight // 2 + 1
+                    lines.append(u'%d:%d:%d\n' % (index, to_index, weight))
+        # one write per lattice row keeps the number of write calls low
+        file_object.write(u''.join(lines))
+
+def __write_edges(file_object, generator, from_index, targets, max_weight):
+    """private helper writing the edges of one node in a single write"""
+    file_object.write(u''.join(
+        u'%d:%d:%d\n' % (from_index, to_index, generator.randint(1, max_weight))
+        for to_index in targets))
+
+def write_open_grid(file_object, width, height, seed=None):
+    """write_open_grid writes a width x height grid without any walls"""
+    rows = (['  '] * width for _ in range(height))
+    __write_grid(file_object, width, rows)
+
+def write_obstacle_grid(file_object, width, height, seed=None, wall_rate=0.25):
+    """
+    write_obstacle_grid writes a grid where wall_rate of the tiles are walls,
+    @1 and @2 are not guaranteed to be connected
+    """
+    generator = random.Random(seed)
+    rows = (['##' if generator.random() < wall_rate else '  ' for _ in range(width)]
+            for _ in range(height))
+    __write_grid(file_object, width, rows)
+
+def write_maze_grid(file_object, width, height, seed=None):
+    """
+    write_maze_grid writes a perfect maze built row by row with the
+    sidewinder algorithm, rooms sit on even coordinates and odd ones are the
+    walls or passages between them
+    """
+    generator = random.Random(seed)
+    __write_grid(file_object, width, __sidewinder_rows(generator, width, height))
+
+def __sidewinder_rows(generator, width, height):
+    """private helper yielding maze rows while holding only one row of rooms"""
+    rooms = (width + 1) // 2
+    for y in range(0, height, 2):
+        room_row = ['##'] * width
+        passage_row = ['##'] * width
+        run_start = 0
+        for room in range(rooms):
+            x = room * 2
+            room_row[x] = '  '
+            at_east_edge = room == rooms - 1 or x + 1 >= width
+            if y == 0 or (not at_east_edge and generator.random() < 0.5):
+                # carve east and extend the current run
+                if not at_east_edge:
+                    room_row[x + 1] = '  '
+                continue
+            # close the run by carving north from one of its rooms
+            north = generator.randint(run_start, room) * 2
+            passage_row[north] = '  '
+            run_start = room + 1
+        if y > 0:
+            yield passage_row
+        yield room_row
+    if height % 2 == 0:
+        # even heights end with dead ends hanging below every room
+        yield ['  ' if x % 2 == 0 else '##' for x in range(width)]
+
+def __write_grid(file_object, width, rows):
+    """
+    private helper writing the grid border and rows, marking the first and
+    last open tiles as @1 and @2 (a grid with a single open tile only gets @1)
+    """
+    border = u'+' + u'-' * (width * 2) + u'+\n'
+    file_object.write(border)
+    start_marked = False
+    # rows are held back from the last one with an open tile, so the goal can
+    # go on it even when all wall rows follow
+    pending = []
+    for row in rows:
+        if not start_marked and '  ' in row:
+            row[row.index('  ')] = '@1'
+            start_marked = True
+        if '  ' in row:
+            __write_rows(file_object, pending)
+            pending = [row]
+        elif pending:
+            pending.append(row)
+        else:
+            __write_rows(file_object, [row])
+    if pending:
+        last_open = pending[0]
+        for x in range(width - 1, -1, -1):
+            if last_open[x] == '  ':
+                last_open[x] = '@2'
+                break
+    __write_rows(file_object, pending)
+    file_object.write(border.rstrip(u'\n'))
+
+def __write_rows(file_object, rows):
+    """private helper writing grid rows between the side walls"""
+    for row in rows:
+        file_object.write(u'|' + u''.join(row) + u'|\n')
+
+GRAPH_WRITERS = {
+    'random': write_random_graph,
+    'scale-free': write_scale_free_graph,
+}
+GRID_WRITERS = {
+    'open': write_open_grid,
+    'obstacle': write_obstacle_grid,
+    'maze': write_maze_grid,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='write synthetic graphs and grids')
+    subparsers = parser.add_subparsers(dest='command')
+
+    graph_parser = subparsers.add_parser('graph')
+    graph_parser.add_argument('kind', choices=sorted(GRAPH_WRITERS) + ['road'])
+    graph_parser.add_argument('--nodes', type=int, default=1000)
+    graph_parser.add_argument('--degree', type=int, default=4)
+    graph_parser.add_argument('--width', type=int, default=100, help='road lattice width')
+    graph_parser.add_argument('--height', type=int, default=100, help='road lattice height')
+
+    grid_parser = subparsers.add_parser('grid')
+    grid_parser.add_argument('kind', choices=sorted(GRID_WRITERS))
+    grid_parser.add_argument('--width', type=int, default=200)
+    grid_parser.add_argument('--height', type=int, default=200)
+
+    for sub_parser in (graph_parser, grid_parser):
+        sub_parser.add_argument('--seed', type=int, default=None)
+        sub_parser.add_argument('-o', '--output', required=True)
+
+    args = parser.parse_args()
+    with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as file_object:
+        if args.command == 'grid':
+            GRID_WRITERS[args.kind](file_object, args.width, args.height, seed=args.seed)
+        elif args.kind == 'road':
+            write_road_graph(file_object, args.width, args.height, seed=args.seed)
+        else:
+            GRAPH_WRITERS[args.kind](file_object, args.nodes, args.degree, seed=args.seed)
+
+if __name__ == "__main__":
+    main()
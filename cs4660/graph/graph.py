@@ -19,23 +19,36 @@ A Graph has following methods:
 * remove_edge
     - remove an edge from its internal data structure
     - returns true if the edge is removed and false if the edge does not exist
+* snapshot()
+    - returns a read only graph of the current version that searches can use
+      while the original keeps being modified
+    - unchanged structures are shared, the writer copies a structure only
+      the first time it modifies it after a snapshot (copy on write)
 """
 
 from io import open
-from operator import itemgetter
 
 def construct_graph_from_file(graph, file_path):
     """
-    TODO: read content from file_path, then add nodes and edges to graph object
+    read content from file_path, then add nodes and edges to graph object
 
     note that grpah object will be either of AdjacencyList, AdjacencyMatrix or ObjectOriented
 
-    In example, you will need to do something similar to following:
-
     1. add number of nodes to graph first (first line)
     2. for each following line (from second line to last line), add them as edge to graph
     3. return the graph
     """
+    with open(file_path, encoding='utf-8') as file_object:
+        number_of_nodes = int(file_object.readline())
+        for index in range(number_of_nodes):
+            graph.add_node(Node(index))
+
+        for line in file_object:
+            line = line.strip()
+            if not line:
+                continue
+            from_index, to_index, weight = line.split(':')
+            graph.add_edge(Edge(Node(int(from_index)), Node(int(to_index)), int(weight)))
     return graph
 
 class Node(object):
@@ -76,6 +89,10 @@ class Edge(object):
         return hash((self.from_node, self.to_node, self.weight))
 
 
+class SnapshotError(Exception):
+    """SnapshotError is raised when modifying a read only graph snapshot"""
+    pass
+
 class AdjacencyList(object):
     """
     AdjacencyList is one of the graph representation which uses adjacency list to
@@ -84,27 +101,85 @@ class AdjacencyList(object):
     def __init__(self):
         # adjacencyList should be a dictonary of node to edges
         self.adjacency_list = {}
+        self.read_only = False
+        # whether adjacency_list is shared with a snapshot, and which edge
+        # lists were copied since the last snapshot
+        self.__shared = False
+        self.__owned = set()
 
     def adjacent(self, node_1, node_2):
-        pass
+        for edge in self.adjacency_list.get(node_1, []):
+            if edge.to_node == node_2:
+                return True
+        return False
 
     def neighbors(self, node):
-        pass
+        return [edge.to_node for edge in self.adjacency_list.get(node, [])]
 
     def add_node(self, node):
-        pass
+        if node in self.adjacency_list:
+            return False
+        self.__writable()
+        self.adjacency_list[node] = []
+        self.__owned.add(node)
+        return True
 
     def remove_node(self, node):
-        pass
+        if node not in self.adjacency_list:
+            return False
+        self.__writable()
+        del self.adjacency_list[node]
+        for from_node, edges in self.adjacency_list.items():
+            self.adjacency_list[from_node] = [edge for edge in edges if edge.to_node != node]
+            self.__owned.add(from_node)
+        return True
 
     def add_edge(self, edge):
-        pass
+        self.add_node(edge.from_node)
+        self.add_node(edge.to_node)
+        if edge in self.adjacency_list[edge.from_node]:
+            return False
+        self.__writable(edge.from_node).append(edge)
+        return True
 
     def remove_edge(self, edge):
-        pass
+        if edge not in self.adjacency_list.get(edge.from_node, []):
+            return False
+        self.__writable(edge.from_node).remove(edge)
+        return True
 
     def distance(self, node_1, node_2):
-        pass
+        for edge in self.adjacency_list.get(node_1, []):
+            if edge.to_node == node_2:
+                return edge.weight
+        return None
+
+    def snapshot(self):
+        if self.read_only:
+            return self
+        snapshot = AdjacencyList()
+        snapshot.adjacency_list = self.adjacency_list
+        snapshot.read_only = True
+        self.__shared = True
+        self.__owned = set()
+        return snapshot
+
+    def __writable(self, node=None):
+        """
+        helper method copying the dictionary, and the edge list of node,
+        if they are still shared with a snapshot, returns that edge list
+        """
+        if self.read_only:
+            raise SnapshotError('graph snapshot is read only')
+        if self.__shared:
+            self.adjacency_list = dict(self.adjacency_list)
+            self.__shared = False
+        if node is None:
+            return None
+        if node not in self.__owned:
+            self.adjacency_list[node] = list(self.adjacency_list[node])
+            self.__owned.add(node)
+        return self.adjacency_list[node]
 
 class AdjacencyMatrix(object):
     def __init__(self):
@@ -114,31 +189,111 @@ class AdjacencyMatrix(object):
         # in additional to the matrix, you will also need to store a list of Nodes
         # as separate list of nodes
         self.nodes = []
+        self.read_only = False
+        # whether the matrix and nodes are shared with a snapshot, and which
+        # rows were copied since the last snapshot
+        self.__shared = False
+        self.__owned_rows = set()
 
     def adjacent(self, node_1, node_2):
-        pass
+        return self.distance(node_1, node_2) is not None
 
     def neighbors(self, node):
-        pass
+        index = self.__get_node_index(node)
+        if index < 0:
+            return []
+        row = self.adjacency_matrix[index]
+        return [self.nodes[to_index] for to_index, weight in enumerate(row) if weight != 0]
 
     def add_node(self, node):
-        pass
+        if self.__get_node_index(node) >= 0:
+            return False
+        self.__writable()
+        self.nodes.append(node)
+        for index in range(len(self.adjacency_matrix)):
+            self.__writable(index).append(0)
+        self.adjacency_matrix.append([0] * len(self.nodes))
+        self.__owned_rows.add(len(self.nodes) - 1)
+        return True
 
     def remove_node(self, node):
-        pass
+        index = self.__get_node_index(node)
+        if index < 0:
+            return False
+        for row_index in range(len(self.adjacency_matrix)):
+            self.__writable(row_index)
+        del self.nodes[index]
+        del self.adjacency_matrix[index]
+        for row in self.adjacency_matrix:
+            del row[index]
+        self.__owned_rows = set(range(len(self.nodes)))
+        return True
 
     def add_edge(self, edge):
-        pass
+        self.add_node(edge.from_node)
+        self.add_node(edge.to_node)
+        from_index = self.__get_node_index(edge.from_node)
+        to_index = self.__get_node_index(edge.to_node)
+        if self.adjacency_matrix[from_index][to_index] != 0:
+            return False
+        self.__writable(from_index)[to_index] = edge.weight
+        return True
 
     def remove_edge(self, edge):
-        pass
+        from_index = self.__get_node_index(edge.from_node)
+        to_index = self.__get_node_index(edge.to_node)
+        if from_index < 0 or to_index < 0 or \
+                self.adjacency_matrix[from_index][to_index] != edge.weight:
+            return False
+        self.__writable(from_index)[to_index] = 0
+        return True
 
     def distance(self, node_1, node_2):
-        pass
+        from_index = self.__get_node_index(node_1)
+        to_index = self.__get_node_index(node_2)
+        if from_index < 0 or to_index < 0:
+            return None
+        weight = self.adjacency_matrix[from_index][to_index]
+        if weight == 0:
+            return None
+        return weight
+
+    def snapshot(self):
+        if self.read_only:
+            return self
+        snapshot = AdjacencyMatrix()
+        snapshot.adjacency_matrix = self.adjacency_matrix
+        snapshot.nodes = self.nodes
+        snapshot.read_only = True
+        self.__shared = True
+        self.__owned_rows = set()
+        return snapshot
 
     def __get_node_index(self, node):
         """helper method to find node index"""
-        pass
+        try:
+            return self.nodes.index(node)
+        except ValueError:
+            return -1
+
+    def __writable(self, index=None):
+        """
+        helper method copying the node list and the outer matrix list, and
+        the row at index, if they are still shared with a snapshot, returns
+        that row
+        """
+        if self.read_only:
+            raise SnapshotError('graph snapshot is read only')
+        if self.__shared:
+            self.adjacency_matrix = list(self.adjacency_matrix)
+            self.nodes = list(self.nodes)
+            self.__shared = False
+        if index is None:
+            return None
+        if index not in self.__owned_rows:
+            self.adjacency_matrix[index] = list(self.adjacency_matrix[index])
+            self.__owned_rows.add(index)
+        return self.adjacency_matrix[index]
 
 class ObjectOriented(object):
     """ObjectOriented defines the edges and nodes as both list"""
@@ -146,24 +301,69 @@ class ObjectOriented(object):
         # implement your own list of edges and nodes
         self.edges = []
         self.nodes = []
+        self.read_only = False
+        # whether edges and nodes are shared with a snapshot
+        self.__shared = False
 
     def adjacent(self, node_1, node_2):
-        pass
+        return self.distance(node_1, node_2) is not None
 
     def neighbors(self, node):
-        pass
+        return [edge.to_node for edge in self.edges if edge.from_node == node]
 
     def add_node(self, node):
-        pass
+        if node in self.nodes:
+            return False
+        self.__writable()
+        self.nodes.append(node)
+        return True
 
     def remove_node(self, node):
-        pass
+        if node not in self.nodes:
+            return False
+        self.__writable()
+        self.nodes.remove(node)
+        self.edges = [edge for edge in self.edges
+                      if edge.from_node != node and edge.to_node != node]
+        return True
 
     def add_edge(self, edge):
-        pass
+        if edge in self.edges:
+            return False
+        self.add_node(edge.from_node)
+        self.add_node(edge.to_node)
+        self.__writable()
+        self.edges.append(edge)
+        return True
 
     def remove_edge(self, edge):
-        pass
+        if edge not in self.edges:
+            return False
+        self.__writable()
+        self.edges.remove(edge)
+        return True
 
     def distance(self, node_1, node_2):
-        pass
+        for edge in self.edges:
+            if edge.from_node == node_1 and edge.to_node == node_2:
+                return edge.weight
+        return None
+
+    def snapshot(self):
+        if self.read_only:
+            return self
+        snapshot = ObjectOriented()
+        snapshot.edges = self.edges
+        snapshot.nodes = self.nodes
+        snapshot.read_only = True
+        self.__shared = True
+        return snapshot
+
+    def __writable(self):
+        """helper method copying edges and nodes if they are still shared with a snapshot"""
+        if self.read_only:
+            raise SnapshotError('graph snapshot is read only')
+        if self.__shared:
+            self.edges = list(self.edges)
+            self.nodes = list(self.nodes)
+            self.__shared = False
@@ -0,0 +1,174 @@
+"""
+profiler module wraps any graph representation to count and time its calls
+
+    profiled = ProfiledGraph(graph.AdjacencyMatrix())
+    ... use profiled as the graph ...
+    print(profiled.report())
+
+recommend() compares AdjacencyList, AdjacencyMatrix and ObjectOriented with a
+cost model of every method (see notes/graph-representation.md) weighted by
+the observed call mix, so the choice of representation is not guesswork
+"""
+
+from __future__ import absolute_import
+
+import sys
+import time
+
+from graph import graph
+
+OPERATIONS = ['adjacent', 'neighbors', 'add_node', 'remove_node',
+              'add_edge', 'remove_edge', 'distance']
+
+# highest resolution clock available, python 2 only has time.time
+TIMER = getattr(time, 'perf_counter', time.time)
+
+# estimated cost of one call given number of nodes (v) and edges (e) of the
+# graph, following how each representation in graph.py is implemented
+COST_MODELS = {
+    'AdjacencyList': {
+        'adjacent': lambda v, e: 1 + e / v,
+        'neighbors': lambda v, e: 1 + e / v,
+        'add_node': lambda v, e: 1,
+        'remove_node': lambda v, e: v + e,
+        'add_edge': lambda v, e: 1 + e / v,
+        'remove_edge': lambda v, e: 1 + e / v,
+        'distance': lambda v, e: 1 + e / v,
+    },
+    'AdjacencyMatrix': {
+        # every method first looks the node index up in the node list
+        'adjacent': lambda v, e: v,
+        'neighbors': lambda v, e: 2 * v,
+        'add_node': lambda v, e: 2 * v,
+        'remove_node': lambda v, e: v * v,
+        'add_edge': lambda v, e: v,
+        'remove_edge': lambda v, e: v,
+        'distance': lambda v, e: v,
+    },
+    'ObjectOriented': {
+        'adjacent': lambda v, e: e,
+        'neighbors': lambda v, e: e,
+        'add_node': lambda v, e: v,
+        'remove_node': lambda v, e: v + e,
+        'add_edge': lambda v, e: v + e,
+        'remove_edge': lambda v, e: e,
+        'distance': lambda v, e: e,
+    },
+}
+
+class ProfiledGraph(object):
+    """
+    ProfiledGraph forwards every graph method to the wrapped graph while
+    counting the calls and the seconds spent in them
+    """
+    def __init__(self, graph_object):
+        self.graph = graph_object
+        self.calls = dict((operation, 0) for operation in OPERATIONS)
+        self.seconds = dict((operation, 0.0) for operation in OPERATIONS)
+
+    def adjacent(self, node_1, node_2):
+        return self.__profile('adjacent', self.graph.adjacent, node_1, node_2)
+
+    def neighbors(self, node):
+        return self.__profile('neighbors', self.graph.neighbors, node)
+
+    def add_node(self, node):
+        return self.__profile('add_node', self.graph.add_node, node)
+
+    def remove_node(self, node):
+        return self.__profile('remove_node', self.graph.remove_node, node)
+
+    def add_edge(self, edge):
+        return self.__profile('add_edge', self.graph.add_edge, edge)
+
+    def remove_edge(self, edge):
+        return self.__profile('remove_edge', self.graph.remove_edge, edge)
+
+    def distance(self, node_1, node_2):
+        return self.__profile('distance', self.graph.distance, node_1, node_2)
+
+    def reset(self):
+        for operation in OPERATIONS:
+            self.calls[operation] = 0
+            self.seconds[operation] = 0.0
+
+    def size(self):
+        """size returns (number of nodes, number of edges) of the wrapped graph"""
+        return graph_size(self.graph)
+
+    def memory_footprint(self):
+        """memory_footprint estimates the bytes held by the wrapped graph"""
+        return deep_sizeof(self.graph)
+
+    def estimated_costs(self):
+        """
+        estimated_costs returns each representation's modelled cost of
+        replaying the observed calls on a graph of the current size
+        """
+        number_of_nodes, number_of_edges = self.size()
+        number_of_nodes = max(number_of_nodes, 1)
+        costs = {}
+        for name, model in COST_MODELS.items():
+            costs[name] = sum(
+                self.calls[operation] * model[operation](float(number_of_nodes), number_of_edges)
+                for operation in OPERATIONS)
+        return costs
+
+    def recommend(self):
+        """recommend returns the representation name with the lowest estimated cost"""
+        costs = self.estimated_costs()
+        return min(sorted(costs), key=lambda name: costs[name])
+
+    def report(self):
+        number_of_nodes, number_of_edges = self.size()
+        return {
+            'representation': self.graph.__class__.__name__,
+            'nodes': number_of_nodes,
+            'edges': number_of_edges,
+            'calls': dict(self.calls),
+            'seconds': dict(self.seconds),
+            'memory_bytes': self.memory_footprint(),
+            'estimated_costs': self.estimated_costs(),
+            'recommended': self.recommend(),
+        }
+
+    def __profile(self, operation, method, *args):
+        """helper method to time one forwarded call"""
+        start_time = TIMER()
+        try:
+            return method(*args)
+        finally:
+            self.seconds[operation] += TIMER() - start_time
+            self.calls[operation] += 1
+
+def graph_size(graph_object):
+    """graph_size returns (number of nodes, number of edges) of any representation"""
+    if isinstance(graph_object, graph.AdjacencyList):
+        return (len(graph_object.adjacency_list),
+                sum(len(edges) for edges in graph_object.adjacency_list.values()))
+    if isinstance(graph_object, graph.AdjacencyMatrix):
+        return (len(graph_object.nodes),
+                sum(1 for row in graph_object.adjacency_matrix for weight in row if weight != 0))
+    return len(graph_object.nodes), len(graph_object.edges)
+
+def deep_sizeof(value, seen=None):
+    """
+    deep_sizeof sums sys.getsizeof over value and everything reachable from
+    it through containers and instance attributes, counting shared objects once
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += deep_sizeof(key, seen) + deep_sizeof(item, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += deep_sizeof(item, seen)
+    elif hasattr(value, '__dict__'):
+        size += deep_sizeof(value.__dict__, seen)
+    return size
@@ -4,6 +4,16 @@ utils package is for some quick utility methods
 such as parsing
 """
 
+from __future__ import absolute_import
+
+from io import open
+
+from graph.graph import Edge, Node
+
+# moves between neighboring tiles and the action letter for each of them
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+ACTIONS = {(0, -1): 'N', (1, 0): 'E', (0, 1): 'S', (-1, 0): 'W'}
+
 class Tile(object):
     """Node represents basic unit of graph"""
     def __init__(self, x, y, symbol):
@@ -35,9 +45,26 @@ def parse_grid_file(graph, file_path):
 
     Returns graph object
     """
-    # TODO: read the filepaht line by line to construct nodes & edges
+    rows = []
+    with open(file_path, encoding='utf-8') as file_object:
+        for line in file_object:
+            line = line.rstrip('\r\n')
+            # skip the +----+ borders and strip the | walls of each row
+            if not line.startswith('|'):
+                continue
+            content = line[1:-1]
+            rows.append([content[index:index + 2] for index in range(0, len(content), 2)])
 
-    # TODO: for each node/edge above, add it to graph
+    for y, row in enumerate(rows):
+        for x, symbol in enumerate(row):
+            if symbol == '##':
+                continue
+            tile = Tile(x, y, symbol)
+            graph.add_node(Node(tile))
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= ny < len(rows) and 0 <= nx < len(rows[ny]) and rows[ny][nx] != '##':
+                    graph.add_edge(Edge(Node(tile), Node(Tile(nx, ny, rows[ny][nx])), 1))
 
     return graph
 
@@ -47,4 +74,9 @@ def convert_edge_to_grid_actions(edges):
 
     e.g. Edge(Node(Tile(1, 2), Tile(2, 2), 1)) => "S"
     """
-    return ""
+    actions = []
+    for edge in edges:
+        from_tile = edge.from_node.data
+        to_tile = edge.to_node.data
+        actions.append(ACTIONS[(to_tile.x - from_tile.x, to_tile.y - from_tile.y)])
+    return "".join(actions)
@@ -12,12 +12,6 @@ TODO: implement Dijkstra utilizing the path with highest effect number
 
 import json
 
-# http lib import for Python 2 and 3: alternative 4
-try:
-    from urllib.request import urlopen, Request
-except ImportError:
-    from urllib2 import urlopen, Request
-
 GET_STATE_URL = "http://192.241.218.106:9000/getState"
 STATE_TRANSITION_URL = "http://192.241.218.106:9000/state"
 
@@ -42,6 +36,13 @@ def __json_request(target_url, body):
     """
     private helper method to send JSON request and parse response JSON
     """
+    # http lib import for Python 2 and 3: alternative 4
+    # imported on first request, so importing this module stays cheap
+    try:
+        from urllib.request import urlopen, Request
+    except ImportError:
+        from urllib2 import urlopen, Request
+
     req = Request(target_url)
     req.add_header('Content-Type', 'application/json; charset=utf-8')
     jsondata = json.dumps(body)
@@ -1,4 +1,87 @@
+"""
+factorial module computes n! naively (fac) and for large n (factorial)
+"""
+
+from collections import OrderedDict
+
+# consecutive numbers multiplied in a plain loop before the product tree,
+# their product stays small enough for fast multiplication
+LEAF_SIZE = 16
+
 def fac(n):
     if n == 0:
         return 1
     return n * fac(n-1)
+
+def range_product(low, high):
+    """
+    range_product returns low * (low + 1) * ... * high (1 when empty)
+
+    products of small leaves are multiplied pairwise level by level, so
+    both sides of every big multiplication have about the same size which is
+    where karatsuba multiplication pays off, no recursion is involved
+    """
+    if high < low:
+        return 1
+
+    products = []
+    for start in range(low, high + 1, LEAF_SIZE):
+        product = 1
+        for number in range(start, min(start + LEAF_SIZE, high + 1)):
+            product *= number
+        products.append(product)
+
+    while len(products) > 1:
+        paired = [products[index] * products[index + 1]
+                  for index in range(0, len(products) - 1, 2)]
+        if len(products) % 2 == 1:
+            paired.append(products[-1])
+        products = paired
+    return products[0]
+
+def factorial(n):
+    """factorial returns n! with a balanced product tree"""
+    if n < 0:
+        raise ValueError('factorial is not defined for negative numbers')
+    return range_product(2, n)
+
+def factorial_mod(n, modulus):
+    """factorial_mod returns n! % modulus without building n!"""
+    if n < 0:
+        raise ValueError('factorial is not defined for negative numbers')
+    if modulus == 1 or n >= modulus:
+        # modulus itself is one of the factors
+        return 0
+    result = 1
+    for number in range(2, n + 1):
+        result = result * number % modulus
+    return result
+
+class FactorialMemo(object):
+    """
+    FactorialMemo keeps up to capacity computed factorials as checkpoints, a
+    new n! only multiplies the range above the closest checkpoint below n,
+    the least recently used checkpoint is dropped once full
+    """
+    def __init__(self, capacity=16):
+        self.capacity = capacity
+        self.checkpoints = OrderedDict()
+
+    def factorial(self, n):
+        if n < 0:
+            raise ValueError('factorial is not defined for negative numbers')
+        if n in self.checkpoints:
+            value = self.checkpoints.pop(n)
+            self.checkpoints[n] = value
+            return value
+
+        base, value = 0, 1
+        for checkpoint, checkpoint_value in self.checkpoints.items():
+            if base < checkpoint < n:
+                base, value = checkpoint, checkpoint_value
+        value *= range_product(base + 1, n)
+
+        self.checkpoints[n] = value
+        if len(self.checkpoints) > self.capacity:
+            self.checkpoints.popitem(last=False)
+        return value
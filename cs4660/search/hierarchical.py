@@ -0,0 +1,313 @@
+"""
+hierarchical module implements HPA* (hierarchical path-finding A*) over grid
+files in the parse_grid_file format
+
+The map is split into region_size x region_size regions. Every region is
+parsed on its own, possibly in a process pool, and reports its portals (the
+tiles on its border where it connects to a neighboring region) with the walking
+distances between them. The portals form a much smaller abstract graph.
+
+A query first runs a_star_search on the abstract graph, with the start and
+goal connected to the portals of their regions. Each abstract edge is then
+refined into tile moves with a bfs inside its region. Paths are near optimal
+(usually within a few percent of flat A*), and query time grows with the
+number of portals instead of the number of tiles.
+
+    grid = HierarchicalGrid('./test/fixtures/grid-5.txt', region_size=16, processes=4)
+    path = grid.a_star_search(Node(Tile(4, 0, '@1')), Node(Tile(201, 206, '@5')))
+"""
+
+from collections import deque
+from io import open
+
+from graph.graph import AdjacencyList, Edge, Node
+from graph.utils import DIRECTIONS, Tile
+from search import searches
+
+WALL = '##'
+
+# borders shared over at least this many tiles get a portal at both ends
+# instead of a single one in the middle
+LONG_ENTRANCE = 6
+
+class HierarchicalGrid(object):
+    """
+    HierarchicalGrid keeps the rows of every region and the abstract portal
+    graph (an AdjacencyList of tile nodes) built from a grid file
+    """
+    def __init__(self, file_path, region_size=16, processes=1):
+        self.file_path = file_path
+        self.region_size = region_size
+        self.width, self.height, self.line_length = grid_dimensions(file_path)
+        # (region x, region y) -> list of row strings, two characters per tile
+        self.regions = {}
+        # (region x, region y) -> list of portal coordinates
+        self.portals = {}
+        self.abstract_graph = AdjacencyList()
+
+        tasks = [(file_path, self.line_length, self.width, self.height, x, y, region_size)
+                 for y in range(0, self.height, region_size)
+                 for x in range(0, self.width, region_size)]
+        if processes > 1:
+            # multiprocessing is only imported when a pool is requested
+            from multiprocessing import Pool
+            pool = Pool(processes)
+            try:
+                results = pool.map(parse_region, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [parse_region(task) for task in tasks]
+
+        for key, rows, portals, intra_edges, inter_edges in results:
+            self.regions[key] = rows
+            self.portals[key] = portals
+        # regions must all be stored before nodes can look their symbols up,
+        # every abstract edge is unique so they skip add_edge's duplicate scan
+        nodes = {}
+        adjacency_list = self.abstract_graph.adjacency_list
+        for _, _, portals, intra_edges, inter_edges in results:
+            for position in portals:
+                nodes[position] = self.node(position)
+                adjacency_list[nodes[position]] = []
+            for position_1, position_2, distance in intra_edges:
+                adjacency_list[nodes[position_1]].append(Edge(nodes[position_1], nodes[position_2], distance))
+                adjacency_list[nodes[position_2]].append(Edge(nodes[position_2], nodes[position_1], distance))
+        for _, _, _, _, inter_edges in results:
+            for position_1, position_2 in inter_edges:
+                adjacency_list[nodes[position_1]].append(Edge(nodes[position_1], nodes[position_2], 1))
+                adjacency_list[nodes[position_2]].append(Edge(nodes[position_2], nodes[position_1], 1))
+
+    def node(self, position):
+        """node returns the graph Node of the tile at (x, y)"""
+        return Node(Tile(position[0], position[1], self.symbol(position)))
+
+    def symbol(self, position):
+        """symbol returns the two character symbol at (x, y), None when outside the map"""
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        key = (x // self.region_size, y // self.region_size)
+        row = self.regions[key][y - key[1] * self.region_size]
+        offset = 2 * (x - key[0] * self.region_size)
+        return row[offset:offset + 2]
+
+    def a_star_search(self, initial_node, dest_node):
+        """
+        a_star_search plans over the abstract graph then refines inside the
+        regions, returning tile Edges like searches.a_star_search
+        """
+        start = (initial_node.data.x, initial_node.data.y)
+        goal = (dest_node.data.x, dest_node.data.y)
+        if self.symbol(start) in (None, WALL) or self.symbol(goal) in (None, WALL):
+            return []
+        if start == goal:
+            return []
+
+        initial_node = self.node(start)
+        dest_node = self.node(goal)
+        extra_edges = {}
+        start_key = self.__region_key(start)
+        goal_key = self.__region_key(goal)
+        distances = self.__region_bfs(start)[0]
+        for portal in self.portals[start_key]:
+            if portal in distances:
+                extra_edges.setdefault(initial_node, {})[self.node(portal)] = distances[portal]
+        if start_key == goal_key and goal in distances:
+            extra_edges.setdefault(initial_node, {})[dest_node] = distances[goal]
+        distances = self.__region_bfs(goal)[0]
+        for portal in self.portals[goal_key]:
+            if portal in distances:
+                extra_edges.setdefault(self.node(portal), {})[dest_node] = distances[portal]
+
+        overlay = OverlayGraph(self.abstract_graph, extra_edges)
+        path = []
+        for edge in searches.a_star_search(overlay, initial_node, dest_node):
+            if edge.weight == 1:
+                path.append(Edge(edge.from_node, edge.to_node, 1))
+            else:
+                path.extend(self.__refine(edge))
+        return path
+
+    def __region_key(self, position):
+        """helper method returning the region holding position"""
+        return position[0] // self.region_size, position[1] // self.region_size
+
+    def __region_bfs(self, position):
+        """helper method running region_bfs from position inside its region"""
+        key = self.__region_key(position)
+        return region_bfs(self.regions[key], key[0] * self.region_size,
+                          key[1] * self.region_size, position)
+
+    def __refine(self, edge):
+        """helper method turning an abstract edge into tile edges inside one region"""
+        start = (edge.from_node.data.x, edge.from_node.data.y)
+        goal = (edge.to_node.data.x, edge.to_node.data.y)
+        parents = self.__region_bfs(start)[1]
+        positions = [goal]
+        while positions[-1] != start:
+            positions.append(parents[positions[-1]])
+        positions.reverse()
+        nodes = [self.node(position) for position in positions]
+        return [Edge(from_node, to_node, 1) for from_node, to_node in zip(nodes[:-1], nodes[1:])]
+
+class OverlayGraph(object):
+    """
+    OverlayGraph adds query specific edges on top of a graph without
+    mutating it, so concurrent queries can share the abstract graph
+    """
+    def __init__(self, graph_object, extra_edges):
+        self.graph = graph_object
+        # node -> {neighbor node: weight}
+        self.extra_edges = extra_edges
+
+    def neighbors(self, node):
+        return self.graph.neighbors(node) + list(self.extra_edges.get(node, {}))
+
+    def distance(self, node_1, node_2):
+        weight = self.extra_edges.get(node_1, {}).get(node_2)
+        if weight is not None:
+            return weight
+        return self.graph.distance(node_1, node_2)
+
+def grid_dimensions(file_path):
+    """
+    grid_dimensions returns (width in tiles, height in tiles, bytes per line)
+    of a grid file, every row has the same length so rows can be seeked to
+    """
+    with open(file_path, 'rb') as file_object:
+        border = file_object.readline()
+        line_length = len(border)
+        width = (len(border.rstrip(b'\r\n')) - 2) // 2
+        height = 0
+        file_object.seek(line_length)
+        # count rows by jumping a whole line at a time
+        while file_object.read(1) == b'|':
+            height += 1
+            file_object.seek(line_length * (height + 1))
+    return width, height, line_length
+
+def parse_region(args):
+    """
+    parse_region reads the region starting at tile (x0, y0) plus one tile
+    around it and returns (region key, region rows, portals, intra region
+    edges, inter region edges to the east and south neighbors)
+
+    portals of a shared border are derived from the same two strips of tiles
+    by both regions, so each region can find its own without coordination
+    """
+    file_path, line_length, width, height, x0, y0, region_size = args
+    x1 = min(x0 + region_size, width)
+    y1 = min(y0 + region_size, height)
+    # the window reaches one tile into each neighbor region
+    wx0, wy0 = max(x0 - 1, 0), max(y0 - 1, 0)
+    wx1, wy1 = min(x1 + 1, width), min(y1 + 1, height)
+
+    window = []
+    with open(file_path, 'rb') as file_object:
+        for y in range(wy0, wy1):
+            file_object.seek(line_length * (y + 1) + 1 + 2 * wx0)
+            window.append(file_object.read(2 * (wx1 - wx0)).decode('utf-8'))
+
+    def passable(x, y):
+        if not (wx0 <= x < wx1 and wy0 <= y < wy1):
+            return False
+        offset = 2 * (x - wx0)
+        return window[y - wy0][offset:offset + 2] != WALL
+
+    portals = []
+    inter_edges = []
+    if x1 < width:
+        for y in __entrances(lambda y: passable(x1 - 1, y) and passable(x1, y), range(y0, y1)):
+            portals.append((x1 - 1, y))
+            inter_edges.append(((x1 - 1, y), (x1, y)))
+    if x0 > 0:
+        for y in __entrances(lambda y: passable(x0 - 1, y) and passable(x0, y), range(y0, y1)):
+            portals.append((x0, y))
+    if y1 < height:
+        for x in __entrances(lambda x: passable(x, y1 - 1) and passable(x, y1), range(x0, x1)):
+            portals.append((x, y1 - 1))
+            inter_edges.append(((x, y1 - 1), (x, y1)))
+    if y0 > 0:
+        for x in __entrances(lambda x: passable(x, y0 - 1) and passable(x, y0), range(x0, x1)):
+            portals.append((x, y0))
+    # a corner tile can be a portal on two borders
+    portals = sorted(set(portals))
+
+    rows = [row[2 * (x0 - wx0):2 * (x1 - wx0)] for row in window[y0 - wy0:y1 - wy0]]
+    region_width = x1 - x0
+    open_cells = [row[offset:offset + 2] != WALL
+                  for row in rows for offset in range(0, 2 * region_width, 2)]
+    intra_edges = []
+    for index, portal in enumerate(portals):
+        distances = __cell_distances(open_cells, region_width,
+                                     (portal[1] - y0) * region_width + portal[0] - x0)
+        for other in portals[index + 1:]:
+            distance = distances[(other[1] - y0) * region_width + other[0] - x0]
+            if distance >= 0:
+                intra_edges.append((portal, other, distance))
+
+    return (x0 // region_size, y0 // region_size), rows, portals, intra_edges, inter_edges
+
+def region_bfs(rows, x0, y0, start):
+    """
+    region_bfs runs a breadth first search from start over the open tiles of
+    one region, whose rows begin at tile (x0, y0), returning (distances,
+    parents) keyed by (x, y)
+    """
+    x1 = x0 + len(rows[0]) // 2
+    y1 = y0 + len(rows)
+    distances = {start: 0}
+    parents = {}
+    queue = deque([start])
+    while queue:
+        position = queue.popleft()
+        distance = distances[position] + 1
+        for dx, dy in DIRECTIONS:
+            x, y = position[0] + dx, position[1] + dy
+            if not (x0 <= x < x1 and y0 <= y < y1) or (x, y) in distances:
+                continue
+            offset = 2 * (x - x0)
+            if rows[y - y0][offset:offset + 2] == WALL:
+                continue
+            distances[(x, y)] = distance
+            parents[(x, y)] = position
+            queue.append((x, y))
+    return distances, parents
+
+def __cell_distances(open_cells, width, start):
+    """
+    private helper running the portal to portal bfs on a flat list of open
+    flags, integer cell indexes keep it much cheaper than tuples and dicts
+    """
+    distances = [-1] * len(open_cells)
+    distances[start] = 0
+    queue = deque([start])
+    size = len(open_cells)
+    while queue:
+        cell = queue.popleft()
+        distance = distances[cell] + 1
+        column = cell % width
+        for neighbor in (cell - width, cell + width,
+                         cell - 1 if column > 0 else -1,
+                         cell + 1 if column + 1 < width else -1):
+            if 0 <= neighbor < size and distances[neighbor] < 0 and open_cells[neighbor]:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+    return distances
+
+def __entrances(is_open, positions):
+    """private helper picking portal positions along one border"""
+    entrances = []
+    run = []
+    for position in list(positions) + [None]:
+        if position is not None and is_open(position):
+            run.append(position)
+            continue
+        if len(run) >= LONG_ENTRANCE:
+            entrances.extend([run[0], run[-1]])
+        elif run:
+            entrances.append(run[len(run) // 2])
+        run = []
+    return entrances
@@ -2,34 +2,339 @@
 Searches module defines all different search algorithms
 """
 
+from collections import deque
+
+from datastructure.structure import IndexedMinHeap
+from graph.graph import Edge
+from graph.profiler import TIMER
+
+class SearchStats(object):
+    """
+    SearchStats collects counters for one search call, searches only record
+    them when an instance is passed as their stats argument
+
+    callback, when given, is called as callback(stats, node) every time a
+    node is expanded
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.nodes_expanded = 0
+        self.edges_relaxed = 0
+        self.heap_pushes = 0
+        self.heap_pops = 0
+        self.max_frontier = 0
+        # seconds spent per phase of the search, e.g. neighbors or path
+        self.phases = {}
+
+    def __str__(self):
+        return 'SearchStats({})'.format(self.as_dict())
+    def __repr__(self):
+        return 'SearchStats({})'.format(self.as_dict())
+
+    def add_time(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+    def as_dict(self):
+        return {
+            'nodes_expanded': self.nodes_expanded,
+            'edges_relaxed': self.edges_relaxed,
+            'heap_pushes': self.heap_pushes,
+            'heap_pops': self.heap_pops,
+            'max_frontier': self.max_frontier,
+            'phases': dict(self.phases),
+        }
+
 def bfs(graph, initial_node, dest_node):
     """
     Breadth First Search
     uses graph to do search from the initial_node to dest_node
     returns a list of actions going from the initial node to dest_node
     """
-    pass
+    if __known_unreachable(graph, initial_node, dest_node):
+        return []
+
+    parents = {}
+    visited = set([initial_node])
+    queue = deque([initial_node])
+
+    while queue:
+        node = queue.popleft()
+        if node == dest_node:
+            return __build_path(parents, initial_node, dest_node)
+        for neighbor in graph.neighbors(node):
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            parents[neighbor] = Edge(node, neighbor, graph.distance(node, neighbor))
+            queue.append(neighbor)
+
+    return []
 
 def dfs(graph, initial_node, dest_node):
     """
     Depth First Search
     uses graph to do search from the initial_node to dest_node
     returns a list of actions going from the initial node to dest_node
+
+    uses an explicit stack of (node, remaining neighbors) frames instead of
+    recursion so deep graphs do not hit the recursion limit, the stack is
+    the current path so no parent map is kept
+    """
+    if initial_node == dest_node or __known_unreachable(graph, initial_node, dest_node):
+        return []
+
+    visited = set([initial_node])
+    stack = [(initial_node, iter(graph.neighbors(initial_node)))]
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            if neighbor == dest_node:
+                return __stack_path(graph, stack, dest_node)
+            stack.append((neighbor, iter(graph.neighbors(neighbor))))
+            break
+        else:
+            stack.pop()
+    return []
+
+def iterative_deepening_search(graph, initial_node, dest_node, max_depth=None):
+    """
+    Iterative Deepening Depth First Search
+    runs depth limited dfs with limits 0, 1, 2, ... up to max_depth (no
+    bound when None) and returns the first, fewest edges, path found
+
+    only nodes on the current path are remembered, so memory is O(depth)
+    at the cost of re-expanding the shallow levels on every iteration
+    """
+    if __known_unreachable(graph, initial_node, dest_node):
+        return []
+
+    depth = 0
+    while max_depth is None or depth <= max_depth:
+        path, cut_off = __depth_limited_search(graph, initial_node, dest_node, depth)
+        if path is not None:
+            return path
+        if not cut_off:
+            # the whole reachable graph fit under the limit
+            return []
+        depth += 1
+    return []
+
+def ida_star_search(graph, initial_node, dest_node, heuristic=None):
+    """
+    IDA* Search
+    iterative deepening on f = g + h: each iteration is a depth first search
+    pruned at the threshold, which grows to the smallest f that was pruned
+
+    heuristic defaults to manhattan_distance, memory is O(depth)
+    """
+    if __known_unreachable(graph, initial_node, dest_node):
+        return []
+    if heuristic is None:
+        heuristic = manhattan_distance
+    threshold = heuristic(initial_node, dest_node)
+    while True:
+        path, next_threshold = __threshold_search(graph, initial_node, dest_node, heuristic, threshold)
+        if path is not None:
+            return path
+        if next_threshold is None:
+            return []
+        threshold = next_threshold
+
+def __depth_limited_search(graph, initial_node, dest_node, limit):
+    """
+    private helper for iterative deepening, returns (path or None, whether
+    any node was not expanded because of the limit)
     """
-    pass
+    if initial_node == dest_node:
+        return [], False
 
-def dijkstra_search(graph, initial_node, dest_node):
+    if limit == 0:
+        return None, True
+
+    cut_off = False
+    on_path = set([initial_node])
+    stack = [(initial_node, iter(graph.neighbors(initial_node)))]
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor in on_path:
+                continue
+            if neighbor == dest_node:
+                return __stack_path(graph, stack, dest_node), cut_off
+            if len(stack) >= limit:
+                cut_off = True
+                continue
+            on_path.add(neighbor)
+            stack.append((neighbor, iter(graph.neighbors(neighbor))))
+            break
+        else:
+            on_path.discard(node)
+            stack.pop()
+    return None, cut_off
+
+def __threshold_search(graph, initial_node, dest_node, heuristic, threshold):
+    """
+    private helper for IDA*, returns (path or None, smallest f above
+    threshold or None when nothing was pruned)
+    """
+    if initial_node == dest_node:
+        return [], None
+
+    next_threshold = None
+    on_path = set([initial_node])
+    # frames are (node, cost from initial_node, remaining neighbors)
+    stack = [(initial_node, 0, iter(graph.neighbors(initial_node)))]
+    while stack:
+        node, cost, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor in on_path:
+                continue
+            neighbor_cost = cost + graph.distance(node, neighbor)
+            estimate = neighbor_cost + heuristic(neighbor, dest_node)
+            if estimate > threshold:
+                if next_threshold is None or estimate < next_threshold:
+                    next_threshold = estimate
+                continue
+            if neighbor == dest_node:
+                return __stack_path(graph, stack, dest_node), None
+            on_path.add(neighbor)
+            stack.append((neighbor, neighbor_cost, iter(graph.neighbors(neighbor))))
+            break
+        else:
+            on_path.discard(node)
+            stack.pop()
+    return None, next_threshold
+
+def __stack_path(graph, stack, dest_node):
+    """private helper turning a stack of (node, ...) frames plus dest_node into edges"""
+    nodes = [frame[0] for frame in stack] + [dest_node]
+    return [Edge(from_node, to_node, graph.distance(from_node, to_node))
+            for from_node, to_node in zip(nodes[:-1], nodes[1:])]
+
+def dijkstra_search(graph, initial_node, dest_node, heap_class=IndexedMinHeap, stats=None):
     """
     Dijkstra Search
     uses graph to do search from the initial_node to dest_node
     returns a list of actions going from the initial node to dest_node
+
+    heap_class may be swapped for structure.RadixHeap when all weights are
+    non negative integers, stats takes a SearchStats to fill in
     """
-    pass
+    return __best_first_search(graph, initial_node, dest_node, heap_class, None, stats)
 
-def a_star_search(graph, initial_node, dest_node):
+def a_star_search(graph, initial_node, dest_node, heap_class=IndexedMinHeap, stats=None):
     """
     A* Search
     uses graph to do search from the initial_node to dest_node
     returns a list of actions going from the initial node to dest_node
+
+    heap_class may be swapped for structure.RadixHeap when all weights are
+    non negative integers, stats takes a SearchStats to fill in
+    """
+    return __best_first_search(graph, initial_node, dest_node, heap_class, manhattan_distance, stats)
+
+def manhattan_distance(node, dest_node):
+    """
+    manhattan_distance is the A* heuristic for grid tiles, nodes without
+    coordinates fall back to zero which turns A* into dijkstra
+    """
+    data = node.data
+    dest_data = dest_node.data
+    if not hasattr(data, 'x') or not hasattr(dest_data, 'x'):
+        return 0
+    return abs(data.x - dest_data.x) + abs(data.y - dest_data.y)
+
+def __best_first_search(graph, initial_node, dest_node, heap_class, heuristic, stats):
+    """
+    private helper shared by dijkstra and A*, every node is queued at most
+    once and improved with decrease_key instead of pushing duplicates
+
+    instrumentation is guarded by stats checks so a disabled search only
+    pays for the comparisons
     """
-    pass
+    if __known_unreachable(graph, initial_node, dest_node):
+        return []
+
+    distances = {initial_node: 0}
+    parents = {}
+    closed = set()
+    frontier = heap_class()
+    frontier.push(initial_node, 0)
+    if stats is not None:
+        start_time = TIMER()
+        stats.heap_pushes += 1
+        stats.max_frontier = max(stats.max_frontier, 1)
+
+    while len(frontier) > 0:
+        node, _ = frontier.pop_min()
+        if stats is not None:
+            stats.heap_pops += 1
+            stats.nodes_expanded += 1
+            if stats.callback is not None:
+                stats.callback(stats, node)
+        if node == dest_node:
+            if stats is not None:
+                path_time = TIMER()
+                stats.add_time('search', path_time - start_time)
+                path = __build_path(parents, initial_node, dest_node)
+                stats.add_time('path', TIMER() - path_time)
+                return path
+            return __build_path(parents, initial_node, dest_node)
+        closed.add(node)
+
+        if stats is not None:
+            neighbors_time = TIMER()
+            neighbors = graph.neighbors(node)
+            stats.add_time('neighbors', TIMER() - neighbors_time)
+        else:
+            neighbors = graph.neighbors(node)
+
+        for neighbor in neighbors:
+            if neighbor in closed:
+                continue
+            weight = graph.distance(node, neighbor)
+            distance = distances[node] + weight
+            if neighbor in distances and distances[neighbor] <= distance:
+                continue
+            distances[neighbor] = distance
+            parents[neighbor] = Edge(node, neighbor, weight)
+            priority = distance
+            if heuristic is not None:
+                priority += heuristic(neighbor, dest_node)
+            if neighbor in frontier:
+                frontier.decrease_key(neighbor, priority)
+            else:
+                frontier.push(neighbor, priority)
+                if stats is not None:
+                    stats.heap_pushes += 1
+            if stats is not None:
+                stats.edges_relaxed += 1
+
+        if stats is not None and len(frontier) > stats.max_frontier:
+            stats.max_frontier = len(frontier)
+
+    if stats is not None:
+        stats.add_time('search', TIMER() - start_time)
+    return []
+
+def __known_unreachable(graph, initial_node, dest_node):
+    """
+    private helper asking graphs that keep a reachability index (such as
+    components.ComponentIndex) whether the search can be skipped
+    """
+    unreachable = getattr(graph, 'unreachable', None)
+    return unreachable is not None and unreachable(initial_node, dest_node)
+
+def __build_path(parents, initial_node, dest_node):
+    """private helper to walk parent edges back from dest_node"""
+    path = []
+    node = dest_node
+    while node != initial_node:
+        edge = parents[node]
+        path.append(edge)
+        node = edge.from_node
+    path.reverse()
+    return path
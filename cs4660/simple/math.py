@@ -1,5 +1,15 @@
 """Math module is simple math module to test student ability to do simple math"""
 
+import operator
+from numbers import Number
+
+try:
+    # python 2 map builds a list, imap is the lazy one
+    from itertools import imap as lazy_map, repeat
+except ImportError:
+    from itertools import repeat
+    lazy_map = map
+
 def add(n_1, n_2):
     """add is simple method taking two integer and return the sume of them"""
     return n_1 + n_2
@@ -7,3 +17,23 @@ def add(n_1, n_2):
 def multiply(n_1, n_2):
     """multiple returns multiplication of two numbers"""
     return n_1 * n_2
+
+def add_all(values_1, values_2):
+    """
+    add_all lazily yields the element-wise sums of two iterables, a plain
+    number as values_2 is added to every value
+    """
+    return __element_wise(operator.add, values_1, values_2)
+
+def multiply_all(values_1, values_2):
+    """
+    multiply_all lazily yields the element-wise products of two iterables, a
+    plain number as values_2 multiplies every value
+    """
+    return __element_wise(operator.mul, values_1, values_2)
+
+def __element_wise(function, values_1, values_2):
+    """private helper mapping function over both iterables in C without building lists"""
+    if isinstance(values_2, Number):
+        values_2 = repeat(values_2)
+    return lazy_map(function, values_1, values_2)
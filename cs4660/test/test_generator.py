@@ -0,0 +1,86 @@
+"""test_generator tests the synthetic graph and grid writers"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from graph import generator
+from graph import graph
+from graph import utils
+from search import searches
+
+class TestGenerator(unittest.TestCase):
+    """Tests generated files can be read back by the parsers"""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, writer, *args, **kwargs):
+        file_path = os.path.join(self.directory, 'generated.txt')
+        with io.open(file_path, 'w', encoding='utf-8') as file_object:
+            writer(file_object, *args, **kwargs)
+        return file_path
+
+    def test_random_graph(self):
+        file_path = self.write(generator.write_random_graph, 50, 3, seed=1)
+        g = graph.construct_graph_from_file(graph.AdjacencyList(), file_path)
+        self.assertEqual(50, len(g.adjacency_list))
+        for node in g.adjacency_list:
+            self.assertEqual(3, len(g.neighbors(node)))
+
+    def test_scale_free_graph(self):
+        file_path = self.write(generator.write_scale_free_graph, 200, 2, seed=1)
+        g = graph.construct_graph_from_file(graph.AdjacencyList(), file_path)
+        in_degree = {}
+        for edges in g.adjacency_list.values():
+            for edge in edges:
+                in_degree[edge.to_node] = in_degree.get(edge.to_node, 0) + 1
+        # low indices are the hubs
+        self.assertTrue(in_degree[graph.Node(0)] > in_degree.get(graph.Node(199), 0))
+
+    def test_road_graph(self):
+        file_path = self.write(generator.write_road_graph, 10, 5, seed=1, drop_rate=0)
+        g = graph.construct_graph_from_file(graph.AdjacencyList(), file_path)
+        self.assertEqual(50, len(g.adjacency_list))
+        self.assertTrue(g.adjacent(graph.Node(11), graph.Node(12)))
+        self.assertTrue(g.adjacent(graph.Node(12), graph.Node(11)))
+
+    def test_road_graph_shortcuts_are_not_parallel(self):
+        file_path = self.write(generator.write_road_graph, 6, 6, seed=2,
+                               drop_rate=0, shortcut_rate=1)
+        with open(file_path) as file_object:
+            pairs = [tuple(line.split(':')[:2]) for line in file_object.readlines()[1:]]
+        self.assertEqual(len(pairs), len(set(pairs)))
+
+    def test_small_grids_get_both_markers(self):
+        for seed in range(20):
+            file_path = self.write(generator.write_obstacle_grid, 3, 3, seed=seed, wall_rate=0.6)
+            with io.open(file_path, encoding='utf-8') as file_object:
+                content = file_object.read()
+            if content.count('  ') + content.count('@') < 2:
+                # a single open tile cannot hold both markers
+                continue
+            self.assertEqual(1, content.count('@1'), seed)
+            self.assertEqual(1, content.count('@2'), seed)
+
+    def test_maze_grid(self):
+        for width, height in [(21, 15), (20, 16)]:
+            file_path = self.write(generator.write_maze_grid, width, height, seed=3)
+            g = utils.parse_grid_file(graph.AdjacencyList(), file_path)
+            start = [node for node in g.adjacency_list if node.data.symbol == '@1']
+            goal = [node for node in g.adjacency_list if node.data.symbol == '@2']
+            self.assertEqual(1, len(start))
+            self.assertEqual(1, len(goal))
+            self.assertNotEqual([], searches.bfs(g, start[0], goal[0]))
+
+    def test_open_grid(self):
+        file_path = self.write(generator.write_open_grid, 8, 6)
+        g = utils.parse_grid_file(graph.AdjacencyList(), file_path)
+        self.assertEqual(48, len(g.adjacency_list))
+        path = searches.a_star_search(
+            g, graph.Node(utils.Tile(0, 0, '@1')), graph.Node(utils.Tile(7, 5, '@2')))
+        self.assertEqual(12, len(path))
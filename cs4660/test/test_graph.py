@@ -3,6 +3,8 @@
 import unittest
 
 from graph import graph
+from graph import components
+from graph import profiler
 
 class TestNode(unittest.TestCase):
     """TestNode tests node implementation"""
@@ -195,3 +197,137 @@ class TestObjectOriented(unittest.TestCase):
         self.assertEqual(False, self.graph_1.remove_edge(graph.Edge(graph.Node(1), graph.Node(6), 1)))
         self.assertEqual(True, self.graph_1.remove_edge(graph.Edge(graph.Node(6), graph.Node(5), 1)))
         self.assertEqual(False, self.graph_1.adjacent(graph.Node(6), graph.Node(5)))
+
+class TestProfiledGraph(unittest.TestCase):
+    def setUp(self):
+        graph_1_path = './test/fixtures/graph-1.txt'
+        self.graph_1 = profiler.ProfiledGraph(graph.AdjacencyMatrix())
+        graph.construct_graph_from_file(self.graph_1, graph_1_path)
+
+    def test_counts_calls(self):
+        self.assertEqual(11, self.graph_1.calls['add_node'])
+        self.assertEqual(16, self.graph_1.calls['add_edge'])
+        self.assertEqual([graph.Node(2), graph.Node(3)], self.graph_1.neighbors(graph.Node(1)))
+        self.assertEqual(True, self.graph_1.adjacent(graph.Node(1), graph.Node(2)))
+        self.assertEqual(1, self.graph_1.calls['neighbors'])
+        self.assertEqual(1, self.graph_1.calls['adjacent'])
+        self.assertTrue(self.graph_1.seconds['add_edge'] > 0)
+        self.assertEqual((11, 16), self.graph_1.size())
+
+    def test_report(self):
+        for _ in range(100):
+            self.graph_1.neighbors(graph.Node(3))
+        report = self.graph_1.report()
+        self.assertEqual('AdjacencyMatrix', report['representation'])
+        self.assertEqual('AdjacencyList', report['recommended'])
+        self.assertTrue(report['memory_bytes'] > 0)
+
+        self.graph_1.reset()
+        self.assertEqual(0, self.graph_1.calls['neighbors'])
+
+class TestComponentIndex(unittest.TestCase):
+    def setUp(self):
+        graph_1_path = './test/fixtures/graph-1.txt'
+        graph_2_path = './test/fixtures/graph-2.txt'
+        self.graph_1 = components.ComponentIndex(
+            graph.construct_graph_from_file(graph.AdjacencyList(), graph_1_path))
+        self.graph_2 = components.ComponentIndex(
+            graph.construct_graph_from_file(graph.ObjectOriented(), graph_2_path))
+
+    def test_strongly_connected_components(self):
+        # graph-1 has no cycle, every node is its own component
+        found = components.strongly_connected_components(self.graph_1.graph)
+        self.assertEqual(11, len(found))
+        # every node of graph-2 is on a path from 0 to 5, so 5 -> 0 joins them all
+        self.graph_2.graph.add_edge(graph.Edge(graph.Node(5), graph.Node(0), 1))
+        found = components.strongly_connected_components(self.graph_2.graph)
+        found = sorted(sorted(node.data for node in component) for component in found)
+        self.assertEqual([[0, 1, 2, 3, 4, 5, 6]], found)
+
+    def test_unreachable(self):
+        self.assertEqual(False, self.graph_1.unreachable(graph.Node(1), graph.Node(8)))
+        self.assertEqual(True, self.graph_1.unreachable(graph.Node(8), graph.Node(1)))
+        self.assertEqual(True, self.graph_1.unreachable(graph.Node(0), graph.Node(1234)))
+        self.assertEqual(True, self.graph_2.unreachable(graph.Node(5), graph.Node(0)))
+        self.assertEqual(True, self.graph_2.unreachable(graph.Node(2), graph.Node(6)))
+        self.assertEqual(False, self.graph_1.strongly_connected(graph.Node(0), graph.Node(8)))
+
+    def test_add_edge_updates_index(self):
+        self.assertEqual(True, self.graph_1.add_edge(graph.Edge(graph.Node(11), graph.Node(12), 1)))
+        self.assertEqual(True, self.graph_1.unreachable(graph.Node(1), graph.Node(11)))
+        self.assertEqual(False, self.graph_1.unreachable(graph.Node(11), graph.Node(12)))
+        self.assertEqual(False, self.graph_1.stale)
+
+        self.graph_1.add_edge(graph.Edge(graph.Node(8), graph.Node(1), 1))
+        self.assertEqual(True, self.graph_1.stale)
+        self.assertEqual(False, self.graph_1.unreachable(graph.Node(8), graph.Node(1)))
+        self.assertEqual(True, self.graph_1.strongly_connected(graph.Node(1), graph.Node(8)))
+
+    def test_growth_stays_incremental(self):
+        indexed = components.ComponentIndex(graph.AdjacencyList())
+        indexed.add_edge(graph.Edge(graph.Node(1), graph.Node(2), 1))
+        # a new node pointing into the graph is ranked first
+        indexed.add_edge(graph.Edge(graph.Node(0), graph.Node(1), 1))
+        self.assertEqual(False, indexed.stale)
+        # joining two weak components cannot close a cycle
+        indexed.add_edge(graph.Edge(graph.Node(5), graph.Node(6), 1))
+        indexed.add_edge(graph.Edge(graph.Node(6), graph.Node(0), 1))
+        self.assertEqual(False, indexed.stale)
+        self.assertEqual(False, indexed.unreachable(graph.Node(5), graph.Node(2)))
+        self.assertEqual(True, indexed.unreachable(graph.Node(2), graph.Node(5)))
+        self.assertEqual(True, indexed.unreachable(graph.Node(1), graph.Node(0)))
+
+        self.assertEqual(True, self.graph_1.add_edge(graph.Edge(graph.Node(1), graph.Node(20), 1)))
+        self.assertEqual(True, self.graph_1.add_edge(graph.Edge(graph.Node(21), graph.Node(0), 1)))
+        self.assertEqual(False, self.graph_1.stale)
+        self.assertEqual(False, self.graph_1.unreachable(graph.Node(21), graph.Node(20)))
+        self.assertEqual(True, self.graph_1.unreachable(graph.Node(20), graph.Node(21)))
+
+    def test_remove_rebuilds_lazily(self):
+        self.assertEqual(True, self.graph_2.remove_edge(graph.Edge(graph.Node(0), graph.Node(1), 4)))
+        self.assertEqual(True, self.graph_2.stale)
+        self.assertEqual(True, self.graph_2.unreachable(graph.Node(0), graph.Node(2)))
+        self.assertEqual(False, self.graph_2.stale)
+        self.assertEqual(True, self.graph_2.remove_node(graph.Node(4)))
+        self.assertEqual(True, self.graph_2.unreachable(graph.Node(0), graph.Node(4)))
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        graph_1_path = './test/fixtures/graph-1.txt'
+        self.graphs = [
+            graph.construct_graph_from_file(representation(), graph_1_path)
+            for representation in [graph.AdjacencyList, graph.AdjacencyMatrix, graph.ObjectOriented]
+        ]
+
+    def test_snapshot_is_isolated(self):
+        for g in self.graphs:
+            snapshot = g.snapshot()
+            self.assertEqual(True, g.add_edge(graph.Edge(graph.Node(1), graph.Node(4), 1)))
+            self.assertEqual(True, g.remove_edge(graph.Edge(graph.Node(6), graph.Node(5), 1)))
+            self.assertEqual(True, g.remove_node(graph.Node(9)))
+            self.assertEqual(True, g.add_node(graph.Node(11)))
+
+            self.assertEqual([graph.Node(2), graph.Node(3)], snapshot.neighbors(graph.Node(1)))
+            self.assertEqual(True, snapshot.adjacent(graph.Node(6), graph.Node(5)))
+            self.assertEqual([graph.Node(6)], snapshot.neighbors(graph.Node(9)))
+            self.assertEqual(False, snapshot.add_node(graph.Node(1)))
+
+            self.assertEqual([graph.Node(2), graph.Node(3), graph.Node(4)], g.neighbors(graph.Node(1)))
+            self.assertEqual(False, g.adjacent(graph.Node(6), graph.Node(5)))
+            self.assertEqual([], g.neighbors(graph.Node(9)))
+
+    def test_snapshot_is_read_only(self):
+        for g in self.graphs:
+            snapshot = g.snapshot()
+            self.assertTrue(snapshot.snapshot() is snapshot)
+            self.assertRaises(graph.SnapshotError, snapshot.add_edge, graph.Edge(graph.Node(1), graph.Node(4), 1))
+            self.assertRaises(graph.SnapshotError, snapshot.remove_node, graph.Node(1))
+
+    def test_snapshot_shares_unchanged_edges(self):
+        g = self.graphs[0]
+        snapshot = g.snapshot()
+        g.add_edge(graph.Edge(graph.Node(1), graph.Node(4), 1))
+        g.add_edge(graph.Edge(graph.Node(1), graph.Node(5), 1))
+        self.assertTrue(snapshot.adjacency_list[graph.Node(3)] is g.adjacency_list[graph.Node(3)])
+        self.assertFalse(snapshot.adjacency_list[graph.Node(1)] is g.adjacency_list[graph.Node(1)])
+        self.assertEqual(2, len(snapshot.adjacency_list[graph.Node(1)]))
@@ -0,0 +1,30 @@
+"""test_recursion tests the factorial implementations"""
+
+import math
+import unittest
+
+from recursion import factorial
+
+class FactorialTestCase(unittest.TestCase):
+    """FactorialTestCase compares every factorial against math.factorial"""
+    def test_fac(self):
+        self.assertEqual(1, factorial.fac(0))
+        self.assertEqual(120, factorial.fac(5))
+
+    def test_factorial(self):
+        for n in [0, 1, 2, 15, 16, 17, 33, 500, 5000]:
+            self.assertEqual(math.factorial(n), factorial.factorial(n))
+        self.assertRaises(ValueError, factorial.factorial, -1)
+
+    def test_factorial_mod(self):
+        self.assertEqual(math.factorial(20) % 1000003, factorial.factorial_mod(20, 1000003))
+        self.assertEqual(0, factorial.factorial_mod(10, 7))
+        self.assertEqual(1, factorial.factorial_mod(0, 7))
+
+    def test_memo(self):
+        memo = factorial.FactorialMemo(capacity=2)
+        self.assertEqual(math.factorial(100), memo.factorial(100))
+        self.assertEqual(math.factorial(300), memo.factorial(300))
+        self.assertEqual(math.factorial(200), memo.factorial(200))
+        self.assertEqual([300, 200], list(memo.checkpoints))
+        self.assertEqual(math.factorial(100), memo.factorial(100))
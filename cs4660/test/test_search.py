@@ -3,9 +3,11 @@
 import unittest
 import time
 
+from search import hierarchical
 from search import searches
 from graph import utils
 from graph import graph
+from graph import components
 
 class TestBFS(unittest.TestCase):
     def setUp(self):
@@ -292,3 +294,121 @@ def construct_grid_graph(file_path):
 
 def string_equal_without_order(string_1, string_2):
     return ''.join(sorted(string_1)) == ''.join(sorted(string_2))
+
+class TestSearchStats(unittest.TestCase):
+    def setUp(self):
+        self.graph = graph.construct_graph_from_file(
+            graph.AdjacencyList(), './test/fixtures/graph-2.txt')
+
+    def test_dijkstra_stats(self):
+        expanded = []
+        stats = searches.SearchStats(callback=lambda stats, node: expanded.append(node))
+        path = searches.dijkstra_search(self.graph, graph.Node(0), graph.Node(5), stats=stats)
+        self.assertEqual(3, len(path))
+        self.assertEqual(graph.Node(0), expanded[0])
+        self.assertEqual(graph.Node(5), expanded[-1])
+        self.assertEqual(len(expanded), stats.nodes_expanded)
+        self.assertEqual(stats.nodes_expanded, stats.heap_pops)
+        self.assertTrue(stats.heap_pushes >= stats.heap_pops)
+        self.assertTrue(stats.edges_relaxed >= stats.heap_pushes - 1)
+        self.assertTrue(stats.max_frontier >= 1)
+        self.assertEqual(set(['search', 'neighbors', 'path']), set(stats.phases))
+
+    def test_component_index_skips_search(self):
+        stats = searches.SearchStats()
+        indexed = components.ComponentIndex(self.graph)
+        self.assertEqual([], searches.dijkstra_search(indexed, graph.Node(5), graph.Node(0), stats=stats))
+        self.assertEqual(0, stats.nodes_expanded)
+        self.assertEqual(2, len(searches.bfs(indexed, graph.Node(0), graph.Node(5))))
+
+    def test_unreachable_stats(self):
+        stats = searches.SearchStats()
+        self.assertEqual([], searches.a_star_search(self.graph, graph.Node(5), graph.Node(0), stats=stats))
+        self.assertEqual(1, stats.nodes_expanded)
+        self.assertTrue('search' in stats.phases)
+
+class TestIterativeSearches(unittest.TestCase):
+    def setUp(self):
+        graph_1_path = './test/fixtures/graph-1.txt'
+        graph_2_path = './test/fixtures/graph-2.txt'
+        self.graph_1 = graph.construct_graph_from_file(graph.AdjacencyList(), graph_1_path)
+        self.graph_2 = graph.construct_graph_from_file(graph.AdjacencyList(), graph_2_path)
+
+    def test_dfs_deep_chain(self):
+        chain = graph.AdjacencyList()
+        for index in range(20000):
+            chain.add_edge(graph.Edge(graph.Node(index), graph.Node(index + 1), 1))
+        path = searches.dfs(chain, graph.Node(0), graph.Node(20000))
+        self.assertEqual(20000, len(path))
+        self.assertEqual(graph.Edge(graph.Node(19999), graph.Node(20000), 1), path[-1])
+
+    def test_iterative_deepening(self):
+        self.assertEqual(
+            [
+                graph.Edge(graph.Node(1), graph.Node(3), 1),
+                graph.Edge(graph.Node(3), graph.Node(10), 1),
+                graph.Edge(graph.Node(10), graph.Node(8), 1)
+            ],
+            searches.iterative_deepening_search(self.graph_1, graph.Node(1), graph.Node(8))
+        )
+        self.assertEqual([], searches.iterative_deepening_search(self.graph_1, graph.Node(1), graph.Node(8), max_depth=2))
+        self.assertEqual([], searches.iterative_deepening_search(self.graph_1, graph.Node(8), graph.Node(1)))
+
+    def test_ida_star(self):
+        self.assertEqual(
+            [
+                graph.Edge(graph.Node(0), graph.Node(6), 3),
+                graph.Edge(graph.Node(6), graph.Node(4), 1),
+                graph.Edge(graph.Node(4), graph.Node(5), 5)
+            ],
+            searches.ida_star_search(self.graph_2, graph.Node(0), graph.Node(5))
+        )
+        self.assertEqual([], searches.ida_star_search(self.graph_2, graph.Node(5), graph.Node(0)))
+
+    def test_ida_star_grid(self):
+        grid = utils.parse_grid_file(graph.AdjacencyList(), './test/fixtures/grid-3.txt')
+        path = utils.convert_edge_to_grid_actions(
+            searches.ida_star_search(
+                grid,
+                graph.Node(utils.Tile(3, 0, "@1")),
+                graph.Node(utils.Tile(2, 7, "@2"))
+            )
+        )
+        self.assertTrue(string_equal_without_order(path, "SSSSEESESSWWWW"))
+
+class TestHierarchical(unittest.TestCase):
+    def test_matches_flat_a_star_5(self):
+        expected_length = 403
+        for processes in [1, 2]:
+            grid = hierarchical.HierarchicalGrid('./test/fixtures/grid-5.txt', region_size=16, processes=processes)
+            path = grid.a_star_search(
+                graph.Node(utils.Tile(4, 0, "@1")),
+                graph.Node(utils.Tile(201, 206, "@5"))
+            )
+            assert_valid_grid_path(self, path, utils.Tile(4, 0, "@1"), utils.Tile(201, 206, "@5"))
+            self.assertTrue(len(path) <= expected_length * 1.05)
+
+    def test_small_regions(self):
+        grid = hierarchical.HierarchicalGrid('./test/fixtures/grid-3.txt', region_size=5)
+        path = grid.a_star_search(
+            graph.Node(utils.Tile(3, 0, "@1")),
+            graph.Node(utils.Tile(2, 7, "@2"))
+        )
+        assert_valid_grid_path(self, path, utils.Tile(3, 0, "@1"), utils.Tile(2, 7, "@2"))
+        # walls are not a valid start
+        self.assertEqual([], grid.a_star_search(
+            graph.Node(utils.Tile(0, 0, "##")),
+            graph.Node(utils.Tile(2, 7, "@2"))
+        ))
+
+def assert_valid_grid_path(test_case, path, start, goal):
+    """Helper asserting path walks open tiles one step at a time from start to goal"""
+    test_case.assertEqual(start, path[0].from_node.data)
+    test_case.assertEqual(goal, path[-1].to_node.data)
+    for edge in path:
+        from_tile = edge.from_node.data
+        to_tile = edge.to_node.data
+        test_case.assertEqual(1, abs(from_tile.x - to_tile.x) + abs(from_tile.y - to_tile.y))
+        test_case.assertNotEqual("##", to_tile.symbol)
+    for edge, next_edge in zip(path[:-1], path[1:]):
+        test_case.assertEqual(edge.to_node, next_edge.from_node)
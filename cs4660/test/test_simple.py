@@ -16,3 +16,13 @@ class MathTestCase(unittest.TestCase):
         self.assertEqual(6, math.multiply(2, 3))
         self.assertEqual(8, math.multiply(2, 4))
         self.assertEqual(8, math.multiply(4, 2))
+
+    def test_add_all_method(self):
+        """test element-wise add over iterables and with a number"""
+        self.assertEqual([5, 7, 9], list(math.add_all([1, 2, 3], iter([4, 5, 6]))))
+        self.assertEqual([11, 12], list(math.add_all((value for value in [1, 2]), 10)))
+
+    def test_multiply_all_method(self):
+        """test element-wise multiply over iterables and with a number"""
+        self.assertEqual([4, 10, 18], list(math.multiply_all([1, 2, 3], [4, 5, 6])))
+        self.assertEqual([2.5, 5.0], list(math.multiply_all([1, 2], 2.5)))
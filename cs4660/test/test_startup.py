@@ -0,0 +1,27 @@
+"""test_startup tests that optional backends are only imported when used"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ['multiprocessing', 'mmap', 'urllib', 'urllib2', 'http']
+
+def imported_modules(statement):
+    """Helper returning the modules a fresh interpreter has after statement"""
+    code = statement + '\nimport sys\nprint(" ".join(sorted(sys.modules)))'
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+    return output.decode('utf-8').split()
+
+class TestStartup(unittest.TestCase):
+    def test_search_worker_imports(self):
+        modules = imported_modules('from graph import graph, utils\nfrom search import searches')
+        for name in LAZY_MODULES:
+            self.assertFalse(name in modules, name)
+
+    def test_optional_modules_import_lazily(self):
+        modules = imported_modules('from quiz import main\nfrom tutorial import files\nfrom search import hierarchical')
+        for name in LAZY_MODULES:
+            self.assertFalse(name in modules, name)
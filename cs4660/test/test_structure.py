@@ -0,0 +1,165 @@
+"""test_structure tests the data structure implementations"""
+
+import unittest
+
+from datastructure import structure
+
+class CollidingKey(object):
+    """CollidingKey always hashes to the same value to force collisions"""
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.name == other.name
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return 42
+
+class TestHashTable(unittest.TestCase):
+    """Tests open addressing hash table implementation"""
+    def setUp(self):
+        self.table = structure.HashTable()
+
+    def test_set_and_get(self):
+        self.table.set('a', 1)
+        self.table.set('b', 2)
+        self.table.set('a', 3)
+        self.assertEqual(3, self.table.get('a'))
+        self.assertEqual(2, self.table.get('b'))
+        self.assertEqual(2, len(self.table))
+        self.assertRaises(KeyError, self.table.get, 'c')
+
+    def test_collisions_keep_values(self):
+        keys = [CollidingKey(name) for name in 'abcde']
+        for index, key in enumerate(keys):
+            self.table.set(key, index)
+        for index, key in enumerate(keys):
+            self.assertEqual(index, self.table.get(key))
+
+    def test_remove_leaves_probe_chain(self):
+        keys = [CollidingKey(name) for name in 'abc']
+        for index, key in enumerate(keys):
+            self.table.set(key, index)
+        self.table.remove(keys[0])
+        # removing an absent key is a noop
+        self.table.remove(keys[0])
+        self.assertFalse(keys[0] in self.table)
+        self.assertEqual(2, self.table.get(keys[2]))
+        self.assertEqual(2, len(self.table))
+
+    def test_resize(self):
+        for index in range(1000):
+            self.table.set(str(index), index)
+        for index in range(0, 1000, 2):
+            self.table.remove(str(index))
+        self.assertEqual(500, len(self.table))
+        self.assertTrue(self.table.capacity * self.table.load_factor >= self.table.used)
+        for index in range(1, 1000, 2):
+            self.assertEqual(index, self.table.get(str(index)))
+
+    def test_rejects_full_load_factor(self):
+        self.assertRaises(ValueError, structure.HashTable, load_factor=1.0)
+        self.assertRaises(ValueError, structure.HashTable, load_factor=0)
+
+class TestTypedList(unittest.TestCase):
+    """Tests array backed typed list implementation"""
+    def setUp(self):
+        self.list = structure.TypedList('i', [1, 2, 3])
+
+    def test_push_and_pop(self):
+        self.list.push(4)
+        self.assertEqual(4, len(self.list))
+        self.assertEqual(4, self.list.pop())
+        self.assertEqual(3, self.list.pop())
+        self.assertEqual([1, 2], list(self.list))
+
+    def test_shift_and_unshift(self):
+        self.list.unshift(0)
+        self.list.unshift(-1)
+        self.assertEqual([-1, 0, 1, 2, 3], list(self.list))
+        self.assertEqual(-1, self.list.shift())
+        self.assertEqual(0, self.list.get(0))
+        for expected in [0, 1, 2, 3]:
+            self.assertEqual(expected, self.list.shift())
+        self.assertEqual(None, self.list.shift())
+        self.assertEqual(None, self.list.pop())
+
+    def test_queue_reuses_memory(self):
+        for value in range(1000):
+            self.list.push(value)
+            self.list.shift()
+        self.assertEqual(3, len(self.list))
+        self.assertTrue(len(self.list.memory) < 100)
+
+    def test_extend_and_view(self):
+        self.list.extend(range(4, 10))
+        view = self.list.view(2, 5)
+        self.assertEqual([3, 4, 5], list(view))
+        self.assertEqual(4, view.get(1))
+        self.assertEqual([3, 4, 5], list(view.to_array()))
+        self.assertRaises(IndexError, view.get, 3)
+        self.assertRaises(OverflowError, self.list.push, 2 ** 80)
+
+    def test_failed_extend_keeps_list(self):
+        self.assertRaises(OverflowError, self.list.extend, [4, 5, 2 ** 80])
+        self.assertEqual([1, 2, 3], list(self.list))
+        self.list.push(4)
+        self.assertEqual(4, self.list.pop())
+
+    def test_view_follows_items_across_shifts(self):
+        self.list.extend([4, 5])
+        view = self.list.view(1, 3)
+        self.list.shift()
+        self.assertEqual([2, 3], list(view))
+        self.list.unshift(0)
+        self.list.unshift(-1)
+        self.assertEqual([2, 3], list(view.to_array()))
+        for _ in range(3):
+            self.list.shift()
+        self.assertRaises(IndexError, view.get, 0)
+        self.assertEqual(3, view.get(1))
+        self.assertEqual([3], list(view.to_array()))
+
+class TestIndexedMinHeap(unittest.TestCase):
+    """Tests indexed binary heap implementation"""
+    def setUp(self):
+        self.heap = structure.IndexedMinHeap()
+
+    def test_pop_in_priority_order(self):
+        for item, priority in [('a', 5), ('b', 1), ('c', 3), ('d', 3), ('e', 0)]:
+            self.heap.push(item, priority)
+        popped = [self.heap.pop_min() for _ in range(5)]
+        self.assertEqual([('e', 0), ('b', 1), ('c', 3), ('d', 3), ('a', 5)], popped)
+        self.assertEqual(None, self.heap.pop_min())
+
+    def test_decrease_key(self):
+        for item, priority in [('a', 5), ('b', 4), ('c', 3)]:
+            self.heap.push(item, priority)
+        self.assertEqual(True, self.heap.decrease_key('a', 1))
+        self.assertEqual(False, self.heap.decrease_key('b', 10))
+        self.assertEqual(False, self.heap.decrease_key('z', 1))
+        self.assertEqual(3, len(self.heap))
+        self.assertEqual(('a', 1), self.heap.pop_min())
+        self.assertEqual(('c', 3), self.heap.pop_min())
+
+class TestRadixHeap(unittest.TestCase):
+    """Tests monotone radix heap implementation"""
+    def setUp(self):
+        self.heap = structure.RadixHeap()
+
+    def test_pop_in_priority_order(self):
+        for item, priority in [('a', 9), ('b', 2), ('c', 17), ('d', 4)]:
+            self.heap.push(item, priority)
+        self.assertEqual(('b', 2), self.heap.pop_min())
+        self.heap.push('e', 3)
+        self.assertEqual(True, self.heap.decrease_key('c', 5))
+        popped = [self.heap.pop_min() for _ in range(4)]
+        self.assertEqual([('e', 3), ('d', 4), ('c', 5), ('a', 9)], popped)
+        self.assertEqual(None, self.heap.pop_min())
+
+    def test_rejects_non_monotone_push(self):
+        self.heap.push('a', 7)
+        self.heap.pop_min()
+        self.assertRaises(ValueError, self.heap.push, 'b', 6)
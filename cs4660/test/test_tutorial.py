@@ -1,5 +1,7 @@
 """test_tutorial is a testing specs for basic Python stuff"""
 
+import os
+import tempfile
 import unittest
 
 from tutorial import lists
@@ -60,3 +62,92 @@ class SimpleFileTestCase(unittest.TestCase):
     def test_sum(self):
         """test_sum tests to see if the file can retrieve sum value"""
         self.assertEqual(36, self.simple_file.get_sum(1))
+
+class StreamingSimpleFileTestCase(unittest.TestCase):
+    """StreamingSimpleFileTestCase tests the single pass streaming mode"""
+
+    def setUp(self):
+        file_path = './test/fixtures/array.txt'
+        self.simple_file = files.SimpleFile(file_path, streaming=True)
+
+    def tearDown(self):
+        self.simple_file.close()
+
+    def test_statistics(self):
+        """test_statistics tests the per line aggregates"""
+        self.assertEqual(5, len(self.simple_file))
+        self.assertEqual(4.125, self.simple_file.get_mean(0))
+        self.assertEqual(9, self.simple_file.get_max(3))
+        self.assertEqual(-5, self.simple_file.get_min(4))
+        self.assertEqual(36, self.simple_file.get_sum(1))
+
+    def test_get_numbers(self):
+        """test_get_numbers tests random access through the line offset index"""
+        self.assertEqual([8, 3, 8, 1, 7, 9, 0, 1], self.simple_file.get_numbers(3))
+        self.assertEqual([4, 6, 7, 1, 43, 8, 2, -5], self.simple_file.get_numbers(4))
+        self.assertEqual([1, 5, 4, 2, 3, 5, 6, 7], self.simple_file.get_numbers(0))
+
+    def test_integers_stay_exact(self):
+        """test_integers_stay_exact tests aggregates match the default mode"""
+        handle, file_path = tempfile.mkstemp()
+        os.write(handle, b'1 9007199254740993 -3\n')
+        os.close(handle)
+        try:
+            default_file = files.SimpleFile(file_path)
+            streaming_file = files.SimpleFile(file_path, streaming=True)
+            for method in ('get_sum', 'get_max', 'get_min', 'get_mean'):
+                expected = getattr(default_file, method)(0)
+                actual = getattr(streaming_file, method)(0)
+                self.assertEqual(expected, actual)
+                self.assertEqual(type(expected), type(actual))
+            self.assertEqual(9007199254740993, streaming_file.get_max(0))
+            streaming_file.close()
+        finally:
+            os.remove(file_path)
+
+class ParallelSimpleFileTestCase(unittest.TestCase):
+    """ParallelSimpleFileTestCase tests the process pool aggregation mode"""
+
+    def test_matches_streaming(self):
+        """test_matches_streaming compares every line against streaming mode"""
+        file_path = './test/fixtures/array.txt'
+        streaming_file = files.SimpleFile(file_path, streaming=True)
+        parallel_file = files.SimpleFile(file_path, processes=3)
+        self.assertEqual(len(streaming_file), len(parallel_file))
+        for line_number in range(len(streaming_file)):
+            self.assertEqual(streaming_file.get_sum(line_number), parallel_file.get_sum(line_number))
+            self.assertEqual(streaming_file.get_min(line_number), parallel_file.get_min(line_number))
+            self.assertEqual(streaming_file.get_max(line_number), parallel_file.get_max(line_number))
+            self.assertEqual(
+                streaming_file.get_numbers(line_number),
+                parallel_file.get_numbers(line_number)
+            )
+        parallel_file.close()
+        streaming_file.close()
+
+    def test_split_ranges(self):
+        """test_split_ranges tests ranges start on line boundaries"""
+        file_path = './test/fixtures/array.txt'
+        ranges = files.split_ranges(file_path, 4)
+        self.assertEqual(0, ranges[0][0])
+        with open(file_path, 'rb') as file_object:
+            content = file_object.read()
+        self.assertEqual(len(content), ranges[-1][1])
+        for start, _ in ranges[1:]:
+            self.assertEqual(b'\n', content[start - 1:start])
+
+class StreamListTestCase(unittest.TestCase):
+    """StreamListTestCase tests the single pass sum and average"""
+
+    def test_stream_sum(self):
+        """test_stream_sum tests generators, exact ints and float precision"""
+        self.assertEqual(4950, lists.stream_sum((value for value in range(100)), chunk_size=7))
+        self.assertEqual(10 ** 30 + 1, lists.stream_sum([10 ** 30, 1]))
+        self.assertEqual(1.0, lists.stream_sum([1e16, 1.0, -1e16], chunk_size=1))
+        self.assertEqual(0, lists.stream_sum([]))
+
+    def test_stream_avg(self):
+        """test_stream_avg tests average over chunks and empty input"""
+        self.assertAlmostEqual(0.1, lists.stream_avg(iter([0.1] * 10), chunk_size=3), places=15)
+        self.assertEqual(2.5, lists.stream_avg([1, 2, 3, 4]))
+        self.assertEqual(None, lists.stream_avg([]))
@@ -1,38 +1,198 @@
 """Files tests simple file read related operations"""
 
+import os
+from array import array
+from io import open
+
+# byte offsets need 64 bits for multi GB files, python 2 has no 'q' type code
+# so it falls back to doubles, which stay exact up to 2 ** 53 bytes
+try:
+    OFFSET_TYPE = 'q'
+    array(OFFSET_TYPE)
+except ValueError:
+    OFFSET_TYPE = 'd'
+
 class SimpleFile(object):
-    """SimpleFile tests using file read api to do some simple math"""
-    def __init__(self, file_path):
+    """
+    SimpleFile tests using file read api to do some simple math
+
+    With streaming=True the file is read once and only the per line mean,
+    max, min and sum are kept, while get_numbers reads a line back through a
+    memory map using the line offset index
+
+    With processes greater than one, streaming is implied and the file is
+    split into line aligned byte ranges aggregated across a process pool
+    """
+    def __init__(self, file_path, streaming=False, processes=1):
+        self.file_path = file_path
+        self.streaming = streaming
         self.numbers = []
+        self.__map = None
+        if processes > 1:
+            self.streaming = True
+            self.offsets, self.sums, self.mins, self.maxs, self.counts = \
+                aggregate_parallel(file_path, processes)
+        elif streaming:
+            self.offsets, self.sums, self.mins, self.maxs, self.counts = \
+                aggregate_range(file_path, 0, None)
+        else:
+            with open(file_path, 'rb') as file_object:
+                for line in file_object:
+                    values = parse_line(line)
+                    if values:
+                        self.numbers.append(values)
+
+    def __len__(self):
+        if self.streaming:
+            return len(self.counts)
+        return len(self.numbers)
+
+    def get_numbers(self, line_number):
         """
-        TODO: reads the file by path and parse content into two
-        dimension array (numbers)
+        get_numbers retrieves the list of values by line_number (starts with
+        zero)
         """
+        if not self.streaming:
+            return self.numbers[line_number]
+
+        if self.__map is None:
+            import mmap
+            with open(self.file_path, 'rb') as file_object:
+                self.__map = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+        start = int(self.offsets[line_number])
+        end = self.__map.find(b'\n', start)
+        if end < 0:
+            end = len(self.__map)
+        return parse_line(self.__map[start:end])
+
+    def close(self):
+        """close releases the memory map opened by get_numbers"""
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
 
     def get_mean(self, line_number):
         """
         get_mean retrieves the mean value of the list by line_number (starts
         with zero)
         """
-        pass
+        if self.streaming:
+            return float(self.sums[line_number]) / self.counts[line_number]
+        values = self.numbers[line_number]
+        return float(sum(values)) / len(values)
 
     def get_max(self, line_number):
         """
         get_max retrieves the maximum value of the list by line_number (starts
         with zero)
         """
-        pass
+        if self.streaming:
+            return self.maxs[line_number]
+        return max(self.numbers[line_number])
 
     def get_min(self, line_number):
         """
         get_min retrieves the minimum value of the list by line_number (starts
         with zero)
         """
-        pass
+        if self.streaming:
+            return self.mins[line_number]
+        return min(self.numbers[line_number])
 
     def get_sum(self, line_number):
         """
         get_sum retrieves the sumation of the list by line_number (starts with
         zero)
         """
-        pass
+        if self.streaming:
+            return self.sums[line_number]
+        return sum(self.numbers[line_number])
+
+def parse_line(line):
+    """parse_line converts a whitespace separated line into a list of numbers"""
+    tokens = line.split()
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        return list(map(float, tokens))
+
+def aggregate_range(file_path, start, end):
+    """
+    aggregate_range streams the lines beginning within the byte range
+    [start, end) (end None means end of file) and returns per line columns of
+    (offsets, sums, mins, maxs, counts), blank lines are skipped
+
+    offsets and counts are arrays, sums, mins and maxs are lists holding the
+    values parse_line produced so integers stay exact like in default mode
+
+    start must be zero or the offset right after a newline
+    """
+    offsets = array(OFFSET_TYPE)
+    sums = []
+    mins = []
+    maxs = []
+    counts = array('L')
+    with open(file_path, 'rb') as file_object:
+        file_object.seek(start)
+        offset = start
+        for line in file_object:
+            if end is not None and offset >= end:
+                break
+            values = parse_line(line)
+            if values:
+                # builtin sum/min/max loop in C over the parsed line
+                offsets.append(offset)
+                sums.append(sum(values))
+                mins.append(min(values))
+                maxs.append(max(values))
+                counts.append(len(values))
+            offset += len(line)
+    return offsets, sums, mins, maxs, counts
+
+def split_ranges(file_path, count):
+    """
+    split_ranges splits the file into at most count byte ranges whose
+    boundaries are moved forward to the start of the next line
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, 'rb') as file_object:
+        for index in range(1, count):
+            position = size * index // count
+            if position <= boundaries[-1]:
+                continue
+            file_object.seek(position - 1)
+            # the rest of the line the guess falls in belongs to the range before
+            file_object.readline()
+            position = file_object.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def aggregate_parallel(file_path, processes):
+    """
+    aggregate_parallel runs aggregate_range over split_ranges in a process
+    pool and concatenates the results in file order
+    """
+    # multiprocessing is only imported by the parallel mode
+    from multiprocessing import Pool
+
+    ranges = [(file_path, start, end) for start, end in split_ranges(file_path, processes)]
+    pool = Pool(processes)
+    try:
+        # map keeps the order of ranges, so the merged table is deterministic
+        chunks = pool.map(__aggregate_range_args, ranges)
+    finally:
+        pool.close()
+        pool.join()
+
+    merged = chunks[0]
+    for chunk in chunks[1:]:
+        for column, values in zip(merged, chunk):
+            column.extend(values)
+    return merged
+
+def __aggregate_range_args(args):
+    """private helper unpacking the pool arguments for aggregate_range"""
+    return aggregate_range(*args)
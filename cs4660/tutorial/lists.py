@@ -1,5 +1,11 @@
 """Lists defines simple list related operations"""
 
+import math
+from itertools import islice
+
+# number of items summed together when streaming an iterable
+CHUNK_SIZE = 4096
+
 def get_first_item(li):
     """Return the first item from the list"""
     pass
@@ -14,8 +20,51 @@ def get_second_and_third_items(li):
 
 def get_sum(li):
     """Return the sum of the list items"""
-    pass
+    return stream_sum(li)
 
 def get_avg(li):
     """Returns the average of the list items"""
-    pass
+    return stream_avg(li)
+
+def stream_sum(items, chunk_size=CHUNK_SIZE):
+    """
+    Return the sum of any iterable (list, array, generator) in a single
+    pass, ints stay exact and floats are summed without rounding drift
+    """
+    return __stream_total(items, chunk_size)[0]
+
+def stream_avg(items, chunk_size=CHUNK_SIZE):
+    """Returns the average of any iterable in a single pass, None when empty"""
+    total, count = __stream_total(items, chunk_size)
+    if count == 0:
+        return None
+    return float(total) / count
+
+def __stream_total(items, chunk_size):
+    """
+    private helper reading items chunk_size at a time and returning
+    (sum, count), float chunks use math.fsum and are combined with a
+    Neumaier compensated sum so large streams keep their precision
+    """
+    iterator = iter(items)
+    total = 0
+    compensation = 0.0
+    count = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        count += len(chunk)
+        partial = sum(chunk)
+        if isinstance(partial, float):
+            partial = math.fsum(chunk)
+        new_total = total + partial
+        if isinstance(new_total, float):
+            if abs(total) >= abs(partial):
+                compensation += (total - new_total) + partial
+            else:
+                compensation += (partial - new_total) + total
+        total = new_total
+    if compensation:
+        total += compensation
+    return total, count